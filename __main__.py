@@ -4,6 +4,7 @@
 import asyncio
 import logging
 
+from command_dispatcher import CommandDispatcher
 from utils.logger import setup_logging
 
 from .cli import run
@@ -11,6 +12,7 @@ from .cli import run
 setup_logging(level=logging.INFO)
 
 if __name__ == "__main__":
+    CommandDispatcher.install_uvloop()
     try:
         asyncio.run(run())
     except KeyboardInterrupt:
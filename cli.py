@@ -3,9 +3,15 @@
 # -----------------------------
 import asyncio
 import atexit
+import bisect
+import copy
 import os
 import platform
+import re
 import readline
+import sys
+from collections import OrderedDict, deque
+from typing import Any
 
 from command_dispatcher import (
     CommandDispatcher,
@@ -17,26 +23,212 @@ from utils.logger import get_logger
 
 logger = get_logger().getChild("CLI")
 
+PYTHON_VERSION = platform.python_version()
+NLU_CACHE_SIZE = 128
+_CHAIN_RE = re.compile(r"\s*&&\s*")
+# Utterances whose meaning depends on NLU history and must never be cached
+_UNCACHED_UTTERANCES = frozenset({"повтори"})
+
+
+class NLUCache:
+    """LRU cache in front of ``jarvis.nlu.process``.
+
+    Results are keyed on the exact (stripped) text and the current user,
+    since entity extraction keeps the original case. Unknown intents are
+    cached as well so repeated typos skip the NLU pipeline. A hit is still
+    recorded in the NLU history, and callers always get their own copy. The
+    cache is dropped whenever the registered commands or NLU patterns and
+    corrections change.
+    """
+
+    def __init__(self, jarvis: Jarvis, maxsize: int = NLU_CACHE_SIZE) -> None:
+        self.jarvis = jarvis
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._version: tuple[int, ...] = self._current_version()
+
+    def _current_version(self) -> tuple[int, ...]:
+        nlu = self.jarvis.nlu
+        return (id(nlu), getattr(nlu, "revision", 0), len(self.jarvis.commands))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def process(self, text: str) -> dict[str, Any]:
+        nlu = self.jarvis.nlu
+        stripped = text.strip()
+        if not stripped or stripped.lower() in _UNCACHED_UTTERANCES:
+            return await nlu.process(text)
+
+        version = self._current_version()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+        key = (stripped, self.jarvis.user_name)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            nlu.record_history(copy.deepcopy(cached))
+            return copy.deepcopy(cached)
+
+        parsed = await nlu.process(text)
+        # Intent model predictions depend on the preceding history
+        if not parsed.get("metadata", {}).get("predicted_by_model"):
+            self._entries[key] = copy.deepcopy(parsed)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return parsed
+
+
+class CommandCompleter:
+    """Readline completer backed by a sorted index of dispatcher commands.
+
+    Prefix lookups use :func:`bisect.bisect_left` instead of scanning every
+    command, and the matches for the current prefix are reused across the
+    successive ``state`` calls readline makes for a single TAB press. The
+    index is rebuilt only when dispatcher handlers are (un)registered.
+    """
+
+    def __init__(self, dispatcher: CommandDispatcher) -> None:
+        self.dispatcher = dispatcher
+        self._commands: list[str] = []
+        self._handler_count = -1
+        self._prefix: str | None = None
+        self._matches: list[str] = []
+
+    def _refresh(self) -> None:
+        handlers = self.dispatcher._handlers
+        count = sum(len(actions) for actions in handlers.values())
+        if count == self._handler_count:
+            return
+        self._commands = sorted(
+            sys.intern(f"{mod} {act}" if act is not None else mod)
+            for mod, actions in handlers.items()
+            for act in actions
+        )
+        self._handler_count = count
+        self._prefix = None
+
+    def matches(self, text: str) -> list[str]:
+        """Return all commands starting with ``text`` in sorted order."""
+        self._refresh()
+        commands = self._commands
+        result: list[str] = []
+        for i in range(bisect.bisect_left(commands, text), len(commands)):
+            if not commands[i].startswith(text):
+                break
+            result.append(commands[i])
+        return result
+
+    def __call__(self, text: str, state: int) -> str | None:
+        if state == 0 or text != self._prefix:
+            self._matches = self.matches(text)
+            self._prefix = text
+        return self._matches[state] if state < len(self._matches) else None
+
+
+class StdinReader:
+    """Read stdin lines directly on the event loop via ``loop.add_reader``.
+
+    Used for piped input so each REPL turn does not round-trip through the
+    default thread pool. Interactive terminals keep using :func:`input` on a
+    worker thread because readline editing, history and completion only work
+    through it; Windows and non-selectable streams (regular files, in-memory
+    buffers) fall back to the same path.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._buffer = b""
+        self._lines: deque[bytes] = deque()
+        self._eof = False
+        self._waiter: asyncio.Future | None = None
+
+    @classmethod
+    def for_stdin(cls) -> "StdinReader | None":
+        """Return a reader for ``sys.stdin`` or ``None`` if it is unsupported."""
+        if sys.platform == "win32":
+            return None
+        try:
+            fd = sys.stdin.fileno()
+            if os.isatty(fd):
+                return None
+        except (AttributeError, OSError, ValueError):
+            return None
+        reader = cls(fd)
+        try:
+            reader._start()
+        except (OSError, ValueError):
+            # e.g. EPERM from epoll for regular files
+            return None
+        return reader
+
+    def _start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self.fd, self._on_readable)
+
+    def close(self) -> None:
+        if self._loop is not None:
+            self._loop.remove_reader(self.fd)
+            self._loop = None
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self.fd, self.CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        if data:
+            *lines, self._buffer = (self._buffer + data).split(b"\n")
+            self._lines.extend(lines)
+        else:
+            self._eof = True
+            self.close()
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def readline(self, prompt: str = "") -> str:
+        """Return the next line without its newline; raise ``EOFError`` at EOF."""
+        if prompt:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+        while not self._lines:
+            if self._eof:
+                if not self._buffer:
+                    raise EOFError
+                self._lines.append(self._buffer)
+                self._buffer = b""
+                break
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._lines.popleft().decode(sys.stdin.encoding or "utf-8")
+
+
+async def read_input(prompt: str, reader: StdinReader | None) -> str:
+    """Read a line of user input without blocking the event loop."""
+    if reader is None:
+        return await asyncio.to_thread(input, prompt)
+    return await reader.readline(prompt)
+
 
 async def run():
+    CommandDispatcher.configure_loop()
     jarvis = Jarvis()
     dispatcher = default_dispatcher
     dispatcher.jarvis = jarvis
     await jarvis.initialize()
+    nlu_cache = NLUCache(jarvis)
 
     # -----------------------------
     # Setup readline history and completion
     # -----------------------------
-    commands: list[str] = []
-    for mod, actions in dispatcher._handlers.items():
-        for act in actions:
-            commands.append(f"{mod} {act}" if act is not None else mod)
-
-    def completer(text: str, state: int) -> str | None:
-        matches = [c for c in commands if c.startswith(text)]
-        return matches[state] if state < len(matches) else None
-
-    readline.set_completer(completer)
+    readline.set_completer(CommandCompleter(dispatcher))
     readline.parse_and_bind("tab: complete")
 
     histfile = os.path.expanduser("~/.jarvis_cli_history")
@@ -45,20 +237,43 @@ async def run():
     except FileNotFoundError:
         pass
     atexit.register(lambda: readline.write_history_file(histfile))
-    print(f"Jarvis CLI (Python {platform.python_version()})")
-    print(f"User: {jarvis.user_name}\n")
-    print("Type 'help' for commands. Type 'exit' to quit.")
-    print("Use 'load --module=<name>' or 'unload --module=<name>' to manage modules.\n")
+    sys.stdout.write(
+        f"Jarvis CLI (Python {PYTHON_VERSION})\n"
+        f"User: {jarvis.user_name}\n\n"
+        "Type 'help' for commands. Type 'exit' to quit.\n"
+        "Use 'load --module=<name>' or 'unload --module=<name>' to manage modules.\n\n"
+    )
+
+    stdin_reader = StdinReader.for_stdin()
+    try:
+        await _repl(jarvis, dispatcher, nlu_cache, stdin_reader)
+    finally:
+        if stdin_reader is not None:
+            stdin_reader.close()
+
 
+async def _repl(
+    jarvis: Jarvis,
+    dispatcher: CommandDispatcher,
+    nlu_cache: NLUCache,
+    stdin_reader: StdinReader | None,
+) -> None:
+    prompt_user: str | None = None
+    prompt = ""
     while True:
         try:
-            prompt = f"[{jarvis.user_name}]> "
-            line = await asyncio.to_thread(input, prompt)
+            user_name = jarvis.user_name
+            if user_name != prompt_user:
+                prompt_user = user_name
+                prompt = f"[{user_name}]> "
+            line = await read_input(prompt, stdin_reader)
             text = line.strip()
             if not text:
                 continue
 
-            chain = [t.strip() for t in text.split("&&") if t.strip()]
+            chain = (
+                [cmd for cmd in _CHAIN_RE.split(text) if cmd] if "&&" in text else ()
+            )
             if len(chain) > 1:
                 results = await dispatcher.dispatch_chain(chain)
                 exit_seen = False
@@ -70,7 +285,7 @@ async def run():
                     if result is not None:
                         print(result)
                         continue
-                    parsed = await jarvis.nlu.process(cmd_text)
+                    parsed = await nlu_cache.process(cmd_text)
                     cmd = parsed.get("intent")
                     handler_tuple = jarvis.commands.get(cmd)
                     if handler_tuple:
@@ -98,7 +313,7 @@ async def run():
                 print(result)
                 continue
 
-            parsed = await jarvis.nlu.process(text)
+            parsed = await nlu_cache.process(text)
             cmd = parsed.get("intent")
             handler_tuple = jarvis.commands.get(cmd)
             if handler_tuple:
@@ -109,6 +324,9 @@ async def run():
             else:
                 print(f"Unknown command: {cmd}")
 
+        except EOFError:
+            print("\nExiting Jarvis...")
+            break
         except KeyboardInterrupt:
             print("\nInterrupted. Type 'exit' to quit.")
         except Exception as e:
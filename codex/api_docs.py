@@ -1,10 +1,28 @@
+import importlib
 import os
 import pydoc
+from functools import lru_cache
+
+
+def _module_mtime(module_name: str) -> float | None:
+    """Return the source mtime of *module_name* or ``None`` if it has no file."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    path = getattr(module, "__file__", None)
+    return os.path.getmtime(path) if path else None
+
+
+@lru_cache(maxsize=64)
+def _render_doc(module_name: str, mtime: float | None) -> str:
+    # ``mtime`` is only part of the cache key so edited modules are re-rendered
+    return pydoc.render_doc(module_name, renderer=pydoc.plaintext)
 
 
 def generate_api_docs(module_name: str, out_path: str) -> str:
     """Write plaintext API documentation for *module_name* to *out_path*."""
-    doc = pydoc.render_doc(module_name, renderer=pydoc.plaintext)
+    doc = _render_doc(module_name, _module_mtime(module_name))
     os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as fh:
         fh.write(doc)
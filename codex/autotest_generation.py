@@ -1,32 +1,45 @@
 import ast
 import asyncio
 import os
-from typing import List
 
 from jarvis.processors.test_generator import TestGeneratorProcessor
 
+FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
 
-async def _generate_for_function(source: str, name: str) -> str:
+
+async def _generate_for_functions(source: str, names: list[str]) -> list[str]:
+    """Generate test code for every function in *names* concurrently."""
     proc = TestGeneratorProcessor()
-    result = await proc.process(
-        "generate", {"function_name": name, "source_code": source}
+    results = await asyncio.gather(
+        *(
+            proc.process("generate", {"function_name": name, "source_code": source})
+            for name in names
+        )
     )
-    return result.get("generated_test", "")
+    return [result.get("generated_test", "") for result in results]
 
 
-def generate_autotests(source_path: str, out_dir: str) -> List[str]:
+def generate_autotests(source_path: str, out_dir: str) -> list[str]:
     """Generate basic pytest tests for each function in *source_path*."""
     with open(source_path, encoding="utf-8") as fh:
         source = fh.read()
     tree = ast.parse(source)
     os.makedirs(out_dir, exist_ok=True)
-    written: List[str] = []
-    for node in tree.body:
-        if isinstance(node, ast.FunctionDef):
-            test_code = asyncio.run(_generate_for_function(source, node.name))
-            if test_code:
-                fname = os.path.join(out_dir, f"test_{node.name}.py")
-                with open(fname, "w", encoding="utf-8") as out:
-                    out.write(test_code)
-                written.append(fname)
+    # Generated tests call functions by bare name, so methods and dunders
+    # (which would raise NameError) are left out
+    names = [
+        node.name
+        for node in tree.body
+        if isinstance(node, FUNC_TYPES) and not node.name.startswith("__")
+    ]
+    if not names:
+        return []
+    written: list[str] = []
+    tests = asyncio.run(_generate_for_functions(source, names))
+    for name, test_code in zip(names, tests, strict=True):
+        if test_code:
+            fname = os.path.join(out_dir, f"test_{name}.py")
+            with open(fname, "w", encoding="utf-8") as out:
+                out.write(test_code)
+            written.append(fname)
     return written
@@ -4,21 +4,36 @@
 
 import ast
 import asyncio
+import atexit
 import importlib
+import json
 import logging
+import logging.handlers
+import marshal
+import multiprocessing
 import os
+import queue
 import signal
+import threading
 import time
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+from functools import lru_cache
 from pathlib import Path
+from types import CodeType
 from typing import Any, Tuple
 
 import aio_pika
+import aiofiles
 import docker
 import hydra
-import restrictedpython
-from anyio import CapacityLimiter, Event, create_task_group
+from anyio import (
+    CancelScope,
+    CapacityLimiter,
+    Event,
+    create_task_group,
+    get_cancelled_exc_class,
+)
 from omegaconf import DictConfig, OmegaConf
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
@@ -28,7 +43,7 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExport
 from prometheus_client import REGISTRY, Counter, Gauge, Histogram, start_http_server
 
 # Core dependencies
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 # UI (optional)
 from rich.logging import RichHandler
@@ -36,12 +51,18 @@ from textual.app import App as TextualApp
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
 from .api_docs import generate_api_docs
 from .autotest_generation import generate_autotests
 
 # Internal modules
 from .executor import run as run_tests
 from .linter_task import run_basic_linter
+from .sandbox import run_child
 
 # Constants
 DEFAULT_CONFIG = {
@@ -65,15 +86,37 @@ DEFAULT_CONFIG = {
     },
 }
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        RichHandler(rich_tracebacks=True),
-        logging.FileHandler("codex_agent.log"),
-    ],
+# Setup logging: callers only enqueue records, Rich rendering and file
+# writes happen on the QueueListener thread instead of the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_file_handler = logging.FileHandler("codex_agent.log")
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    RichHandler(rich_tracebacks=True),
+    _file_handler,
+    respect_handler_level=True,
 )
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched for the in-process listener.
+
+    The stock ``prepare`` merges the traceback into the message and clears
+    ``exc_info`` so records can be pickled; that is unnecessary here and
+    would stop ``RichHandler`` from rendering rich tracebacks.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_handler = _LocalQueueHandler(_log_queue)
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("codex_agent")
 
 # Setup tracing
@@ -95,6 +138,181 @@ TASK_DURATION = Histogram(
 )
 AGENT_STATE = Gauge("codex_agent_state", "Current agent state", ["state"])
 
+# Task code runs in processes forked from a forkserver that preloads only
+# the lightweight sandbox module, so starting one per task stays cheap.
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _MP_CONTEXT = multiprocessing.get_context("forkserver")
+    _MP_CONTEXT.set_forkserver_preload([f"{__package__}.sandbox"])
+else:
+    _MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+@lru_cache(maxsize=256)
+def _parse_code(code: str) -> ast.Module:
+    """Parse task code once; shared by validation and compilation."""
+    return ast.parse(code)
+
+
+# Task code may only use these constructs; anything else (imports, scope
+# statements, class definitions, async code, ...) is rejected outright.
+_ALLOWED_NODES = (
+    ast.Module,
+    ast.Expr,
+    ast.Assign,
+    ast.AugAssign,
+    ast.AnnAssign,
+    ast.Delete,
+    ast.Pass,
+    ast.If,
+    ast.For,
+    ast.While,
+    ast.Break,
+    ast.Continue,
+    ast.Try,
+    ast.ExceptHandler,
+    ast.Raise,
+    ast.Assert,
+    ast.FunctionDef,
+    ast.Lambda,
+    ast.arguments,
+    ast.arg,
+    ast.Return,
+    ast.Name,
+    ast.Constant,
+    ast.Attribute,
+    ast.Subscript,
+    ast.Slice,
+    ast.Starred,
+    ast.Call,
+    ast.keyword,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.IfExp,
+    ast.NamedExpr,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+    ast.Dict,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+    ast.comprehension,
+    ast.JoinedStr,
+    ast.FormattedValue,
+    ast.expr_context,
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+)
+# Methods and properties of the builtin value types task code works with.
+# Introspection attributes (gi_frame, cr_frame, f_back, f_builtins,
+# f_globals, tb_frame, co_code, ...) are deliberately absent.
+_ALLOWED_ATTRS = frozenset(
+    {
+        # str
+        "capitalize",
+        "casefold",
+        "center",
+        "count",
+        "encode",
+        "endswith",
+        "expandtabs",
+        "find",
+        "isalnum",
+        "isalpha",
+        "isdigit",
+        "islower",
+        "isnumeric",
+        "isspace",
+        "isupper",
+        "join",
+        "ljust",
+        "lower",
+        "lstrip",
+        "partition",
+        "removeprefix",
+        "removesuffix",
+        "replace",
+        "rfind",
+        "rjust",
+        "rpartition",
+        "rsplit",
+        "rstrip",
+        "split",
+        "splitlines",
+        "startswith",
+        "strip",
+        "swapcase",
+        "title",
+        "upper",
+        "zfill",
+        # bytes
+        "decode",
+        "hex",
+        # list / tuple
+        "append",
+        "extend",
+        "index",
+        "insert",
+        "pop",
+        "remove",
+        "reverse",
+        "sort",
+        # dict
+        "clear",
+        "copy",
+        "get",
+        "items",
+        "keys",
+        "popitem",
+        "setdefault",
+        "update",
+        "values",
+        # set
+        "add",
+        "difference",
+        "discard",
+        "intersection",
+        "isdisjoint",
+        "issubset",
+        "issuperset",
+        "symmetric_difference",
+        "union",
+        # numbers
+        "bit_length",
+        "conjugate",
+        "imag",
+        "is_integer",
+        "real",
+    }
+)
+
+
+class CodeSecurityError(ValueError):
+    """Raised when task code uses a construct that is not allowed."""
+
+
+def _check_code_security(tree: ast.AST) -> None:
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise CodeSecurityError(f"{type(node).__name__} is not allowed")
+        if isinstance(node, ast.Attribute) and node.attr not in _ALLOWED_ATTRS:
+            raise CodeSecurityError(f"Access to {node.attr!r} is not allowed")
+        if isinstance(node, ast.Name) and node.id.startswith("_"):
+            raise CodeSecurityError(f"Use of {node.id!r} is not allowed")
+
+
+@lru_cache(maxsize=256)
+def _safe_compile(code: str) -> CodeType:
+    """Validate *code* in a single AST walk and compile the same tree."""
+    tree = _parse_code(code)
+    _check_code_security(tree)
+    return compile(tree, "<task>", "exec")
+
 
 class TaskPriority(Enum):
     LOW = 1
@@ -121,15 +339,24 @@ class Task(BaseModel):
     type: TaskType = Field(TaskType.CODE_EXECUTION, description="Task type")
     dependencies: list[str] = Field([], description="list of dependent task IDs")
 
-    @validator("code")
+    @field_validator("code")
+    @classmethod
     def validate_code(cls, v):
         if v:
             try:
-                ast.parse(v)
+                _parse_code(v)
             except SyntaxError as e:
                 raise ValueError(f"Invalid Python code: {e}")
         return v
 
+    def get_compiled(self) -> CodeType:
+        """Return the security-checked code object, reusing the validation parse.
+
+        Raises:
+            CodeSecurityError: If the code uses a forbidden construct.
+        """
+        return _safe_compile(self.code)
+
 
 class TaskResult(BaseModel):
     success: bool
@@ -139,7 +366,7 @@ class TaskResult(BaseModel):
     output_files: list[str] = Field(default_factory=list)
 
 
-class AgentState(Enum):
+class AgentState(IntEnum):
     STOPPED = auto()
     STARTING = auto()
     RUNNING = auto()
@@ -161,22 +388,95 @@ class CodexConfig:
     rabbitmq_queue: str = "codex_tasks"
     sandbox_enabled: bool = True
     memory_limit_mb: int = 100
+    sandbox_image: str = "python:3.9-slim"
 
 
 class ModuleReloader(FileSystemEventHandler):
-    def __init__(self, agent):
+    """Reload Python modules when their source files change.
+
+    Editors emit several events per save, so changes are coalesced per path
+    and a module is reloaded only once its file has been quiet for
+    ``debounce`` seconds. Events outside ``roots`` and files listed in
+    ``exclude`` are ignored.
+    """
+
+    def __init__(
+        self,
+        agent,
+        roots: list[Path] | None = None,
+        debounce: float = 0.2,
+        exclude: list[Path] | None = None,
+    ):
         self.agent = agent
+        self.roots = [root.resolve() for root in (roots or [Path.cwd()])]
+        self.exclude = frozenset(path.resolve() for path in (exclude or []))
+        self.debounce = debounce
+        self._pending: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def _is_watched(self, src_path: str) -> bool:
+        if not src_path.endswith(".py") or "__pycache__" in src_path:
+            return False
+        path = Path(src_path).resolve()
+        if path in self.exclude:
+            return False
+        return any(path.is_relative_to(root) for root in self.roots)
 
     def on_modified(self, event):
-        if event.src_path.endswith(".py"):
-            module_name = Path(event.src_path).stem
-            try:
-                module = importlib.import_module(module_name)
-                importlib.reload(module)
-                logger.info(f"♻️ Reloaded module: {module_name}")
-                self.agent.on_module_reload(module_name)
-            except Exception as e:
-                logger.error(f"Failed to reload module {module_name}: {e}")
+        if event.is_directory or not self._is_watched(event.src_path):
+            return
+        with self._lock:
+            self._pending[event.src_path] = time.monotonic()
+            if self._timer is None:
+                self._schedule(self.debounce)
+
+    def _schedule(self, delay: float) -> None:
+        self._timer = threading.Timer(delay, self._flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            ready = [p for p, ts in self._pending.items() if now - ts >= self.debounce]
+            for path in ready:
+                del self._pending[path]
+            if self._pending:
+                oldest = min(self._pending.values())
+                self._schedule(max(self.debounce - (now - oldest), 0.0))
+            else:
+                self._timer = None
+        for path in ready:
+            self._reload(self._module_name(Path(path)))
+
+    def _module_name(self, path: Path) -> str:
+        """Return the dotted import name of *path* relative to its watch root."""
+        path = path.resolve()
+        for root in self.roots:
+            if path.is_relative_to(root):
+                # Roots are package directories, so include the root name
+                parts = path.relative_to(root.parent).with_suffix("").parts
+                if parts[-1] == "__init__":
+                    parts = parts[:-1]
+                return ".".join(parts)
+        return path.stem
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending.clear()
+
+    def _reload(self, module_name: str) -> None:
+        try:
+            module = importlib.import_module(module_name)
+            importlib.reload(module)
+            logger.info(f"♻️ Reloaded module: {module_name}")
+            self.agent.on_module_reload(module_name)
+        except Exception as e:
+            logger.error(f"Failed to reload module {module_name}: {e}")
 
 
 class CodexDashboard(TextualApp):
@@ -191,14 +491,49 @@ class CodexDashboard(TextualApp):
 class CodexAgent:
     def __init__(self, config: CodexConfig = None):
         self.config = config or CodexConfig(**DEFAULT_CONFIG["agent"])
+        self._state_gauges = {
+            state: AGENT_STATE.labels(state=state.name) for state in AgentState
+        }
+        self._state: AgentState | None = None
         self.state = AgentState.STOPPED
         self._shutdown_event = Event()
         self._task_limiter = CapacityLimiter(self.config.max_concurrent_tasks)
         self._current_tasks = set()
         self._docker_client = docker.from_env() if self.config.sandbox_enabled else None
+        self._container_pool: asyncio.Queue | None = None
         self._observer = None
+        self._reloader: ModuleReloader | None = None
+        self._metric_cache = self._build_metric_cache()
         self._setup_metrics()
 
+    @staticmethod
+    def _build_metric_cache() -> dict[TaskType, dict[str, Any]]:
+        """Bind labelled metric children once so tasks skip ``labels()`` lookups."""
+        return {
+            task_type: {
+                **{
+                    status: TASKS_EXECUTED.labels(
+                        status=status, task_type=task_type.value
+                    )
+                    for status in ("success", "failed", "timeout", "error")
+                },
+                "duration": TASK_DURATION.labels(task_type=task_type.value),
+            }
+            for task_type in TaskType
+        }
+
+    @property
+    def state(self) -> AgentState:
+        return self._state
+
+    @state.setter
+    def state(self, value: AgentState) -> None:
+        # Update the state gauge on transitions instead of polling it
+        if self._state is not None:
+            self._state_gauges[self._state].set(0)
+        self._state_gauges[value].set(1)
+        self._state = value
+
     def _setup_metrics(self):
         if self.config.enable_metrics:
             start_http_server(self.config.metrics_port)
@@ -216,7 +551,7 @@ class CodexAgent:
 
         self._shutdown_event = Event()
         self._start_module_watcher()
-        self._start_metrics_updater()
+        await self._start_container_pool()
 
         try:
             async with create_task_group() as tg:
@@ -226,40 +561,45 @@ class CodexAgent:
                 self.state = AgentState.RUNNING
                 logger.info("🚀 CodexAgent is ready")
                 await self._shutdown_event.wait()
+                # Stop the polling loop and RabbitMQ consumer with the group
+                tg.cancel_scope.cancel()
         finally:
             await self.stop()
 
     async def stop(self):
-        self.state = AgentState.STOPING
+        self.state = AgentState.STOPPING
         logger.info("🛑 Stopping CodexAgent...")
 
         self._shutdown_event.set()
         if self._observer:
             self._observer.stop()
             self._observer.join()
+        if self._reloader:
+            self._reloader.cancel()
 
         for task in self._current_tasks:
             task.cancel()
 
         await asyncio.gather(*self._current_tasks, return_exceptions=True)
         self._current_tasks.clear()
+        await self._stop_container_pool()
 
         self.state = AgentState.STOPPED
         logger.info("CodexAgent stopped")
 
     def _start_module_watcher(self):
+        # Watch only the agent's own package instead of the whole CWD
+        # (.git, virtualenvs, output directories ...). On Linux the default
+        # Observer is inotify based.
+        roots = [Path(__file__).resolve().parent]
         self._observer = Observer()
-        self._observer.schedule(ModuleReloader(self), path=".", recursive=True)
+        # Reloading this module would re-register its Prometheus collectors
+        # and start a second log listener, so it is never hot-reloaded.
+        self._reloader = ModuleReloader(self, roots=roots, exclude=[Path(__file__)])
+        for root in roots:
+            self._observer.schedule(self._reloader, path=str(root), recursive=True)
         self._observer.start()
 
-    def _start_metrics_updater(self):
-        async def _update_metrics():
-            while self.state == AgentState.RUNNING:
-                AGENT_STATE.labels(state=self.state.name).set(1)
-                await asyncio.sleep(5)
-
-        asyncio.create_task(_update_metrics())
-
     async def _run_loop(self):
         while self.state == AgentState.RUNNING:
             try:
@@ -279,19 +619,35 @@ class CodexAgent:
         )
 
         channel = await connection.channel()
+        # Let the broker keep up to max_concurrent_tasks unacked messages in
+        # flight; _process_task's limiter bounds the actual concurrency.
+        await channel.set_qos(prefetch_count=self.config.max_concurrent_tasks)
         queue = await channel.declare_queue(self.config.rabbitmq_queue)
 
-        async for message in queue:
-            async with message.process():
-                try:
-                    task = Task.parse_raw(message.body)
-                    await self._process_task(task)
-                except ValidationError as e:
-                    logger.error(f"Invalid task format: {e}")
+        async with create_task_group() as tg:
+            async for message in queue:
+                tg.start_soon(self._process_message, message)
+
+    async def _process_message(self, message):
+        # message.process() acks on success and rejects if processing raises;
+        # a shutdown cancellation hands the message back to the queue instead
+        async with message.process(ignore_processed=True):
+            try:
+                task = Task.model_validate_json(message.body)
+            except ValidationError as e:
+                logger.error(f"Invalid task format: {e}")
+                return
+            try:
+                await self._process_task(task)
+            except get_cancelled_exc_class():
+                with CancelScope(shield=True):
+                    await message.nack(requeue=True)
+                raise
 
     async def _process_task(self, task: Task):
         task_start_time = time.monotonic()
         task_span = tracer.start_as_current_span(f"task.{task.type.value}")
+        metrics = self._metric_cache[task.type]
 
         try:
             async with self._task_limiter:
@@ -329,31 +685,27 @@ class CodexAgent:
 
                 if success:
                     await self._mark_task_completed(task.id, result)
-                    TASKS_EXECUTED.labels(
-                        status="success", task_type=task.type.value
-                    ).inc()
+                    metrics["success"].inc()
                     logger.info(f"✅ Task {task.id} completed in {exec_time:.2f}s")
                 else:
                     await self._mark_task_failed(task.id, result)
-                    TASKS_EXECUTED.labels(
-                        status="failed", task_type=task.type.value
-                    ).inc()
+                    metrics["failed"].inc()
                     logger.warning(f"❌ Task {task.id} failed")
 
-                TASK_DURATION.labels(task_type=task.type.value).observe(exec_time)
+                metrics["duration"].observe(exec_time)
                 task_span.set_status(trace.Status.OK if success else trace.Status.ERROR)
 
         except asyncio.TimeoutError:
             exec_time = time.monotonic() - task_start_time
             logger.error(f"⏰ Task {task.id} timed out after {exec_time:.2f}s")
             await self._mark_task_failed(task.id, "Timeout exceeded")
-            TASKS_EXECUTED.labels(status="timeout", task_type=task.type.value).inc()
+            metrics["timeout"].inc()
             task_span.set_status(trace.Status.ERROR)
         except Exception as e:
             exec_time = time.monotonic() - task_start_time
             logger.error(f"⚠️ Critical error in task {task.id}: {e}", exc_info=True)
             await self._mark_task_failed(task.id, str(e))
-            TASKS_EXECUTED.labels(status="error", task_type=task.type.value).inc()
+            metrics["error"].inc()
             task_span.record_exception(e)
             task_span.set_status(trace.Status.ERROR)
         finally:
@@ -366,7 +718,9 @@ class CodexAgent:
 
     async def _generate_tests(self, task: Task) -> Tuple[bool, str, list[str]]:
         try:
-            output_files = generate_autotests(task.file_path, task.output_path)
+            output_files = await asyncio.to_thread(
+                generate_autotests, task.file_path, task.output_path
+            )
             return True, f"Generated {len(output_files)} test files", output_files
         except Exception as e:
             return False, str(e), []
@@ -376,7 +730,9 @@ class CodexAgent:
             output_path = os.path.join(
                 task.output_path, f"{Path(task.file_path).stem}_api.txt"
             )
-            output_file = generate_api_docs(Path(task.file_path).stem, output_path)
+            output_file = await asyncio.to_thread(
+                generate_api_docs, Path(task.file_path).stem, output_path
+            )
             return True, f"Generated API docs at {output_file}", [output_file]
         except Exception as e:
             return False, str(e), []
@@ -385,8 +741,8 @@ class CodexAgent:
         try:
             errors = run_basic_linter(task.file_path)
             output_path = os.path.join(task.output_path, "lint_results.txt")
-            with open(output_path, "w") as f:
-                f.write("\n".join(errors))
+            async with aiofiles.open(output_path, "w") as f:
+                await f.write("\n".join(errors))
             success = len(errors) == 0
             message = (
                 f"Found {len(errors)} linting issues"
@@ -401,23 +757,18 @@ class CodexAgent:
         try:
             test_results = await run_tests(task.file_path)
             output_path = os.path.join(task.output_path, "test_results.json")
-            with open(output_path, "w") as f:
-                import json
-
-                json.dump(test_results, f)
+            async with aiofiles.open(output_path, "w") as f:
+                await f.write(json.dumps(test_results))
             success = all(r["passed"] for r in test_results.values())
             return success, "Test run completed", [output_path]
         except Exception as e:
             return False, str(e), []
 
-    async def _run_in_container(self, task: Task) -> Tuple[bool, str]:
-        if not self._docker_client:
-            raise RuntimeError("Docker sandbox is not available")
-
-        container = await asyncio.to_thread(
+    async def _spawn_sandbox_container(self):
+        return await asyncio.to_thread(
             self._docker_client.containers.run,
-            "python:3.9-slim",
-            f"python -c '{task.code}'",
+            self.config.sandbox_image,
+            ["tail", "-f", "/dev/null"],
             detach=True,
             mem_limit=f"{self.config.memory_limit_mb}m",
             network_mode="none",
@@ -425,33 +776,96 @@ class CodexAgent:
             cpu_quota=50000,
         )
 
-        try:
-            result = await asyncio.wait_for(
-                asyncio.to_thread(container.wait), timeout=task.timeout
+    async def _start_container_pool(self):
+        """Start ``max_concurrent_tasks`` idle sandbox containers."""
+        if not self._docker_client or self._container_pool is not None:
+            return
+        self._container_pool = asyncio.Queue()
+        containers = await asyncio.gather(
+            *(
+                self._spawn_sandbox_container()
+                for _ in range(self.config.max_concurrent_tasks)
             )
-            logs = await asyncio.to_thread(container.logs)
-            return result["StatusCode"] == 0, logs.decode()
-        finally:
+        )
+        for container in containers:
+            self._container_pool.put_nowait(container)
+        logger.info(f"🐳 Started {len(containers)} sandbox containers")
+
+    async def _stop_container_pool(self):
+        if self._container_pool is None:
+            return
+        pool, self._container_pool = self._container_pool, None
+        while not pool.empty():
+            container = pool.get_nowait()
             await asyncio.to_thread(container.remove, force=True)
 
-    async def _run_in_process(self, task: Task) -> Tuple[bool, str]:
-        try:
-            if task.code and not self._validate_code_security(task.code):
-                return False, "Code security validation failed"
+    async def _release_container(self, container):
+        """Discard *container* and refill the pool with a fresh one.
 
-            exec_globals = {}
-            exec(task.code, exec_globals)
-            return True, "Execution successful"
+        Containers are never reused: a restart keeps the writable layer, so
+        files written by one task would be visible to the next. The pool only
+        keeps fresh containers warm so tasks skip the start-up latency.
+        """
+        try:
+            await asyncio.to_thread(container.remove, force=True)
         except Exception as e:
-            return False, str(e)
+            logger.warning(f"Failed to remove sandbox container {container.id}: {e}")
+        if self._container_pool is None:
+            # Pool was shut down while the task was running
+            return
+        # Always refill, or acquirers would eventually block forever
+        fresh = await self._spawn_sandbox_container()
+        if self._container_pool is None:
+            await asyncio.to_thread(fresh.remove, force=True)
+            return
+        self._container_pool.put_nowait(fresh)
+
+    async def _run_in_container(self, task: Task) -> Tuple[bool, str]:
+        if not self._docker_client:
+            raise RuntimeError("Docker sandbox is not available")
+        if self._container_pool is None:
+            await self._start_container_pool()
 
-    def _validate_code_security(self, code: str) -> bool:
+        container = await self._container_pool.get()
         try:
-            restrictedpython.compile_restricted(code, "<string>", "exec")
-            return True
-        except Exception as e:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(container.exec_run, ["python", "-c", task.code]),
+                timeout=task.timeout,
+            )
+            return result.exit_code == 0, result.output.decode()
+        finally:
+            await self._release_container(container)
+
+    async def _run_in_process(self, task: Task) -> tuple[bool, str]:
+        try:
+            code = task.get_compiled()
+        except CodeSecurityError as e:
             logger.warning(f"Security validation failed: {e}")
-            return False
+            return False, "Code security validation failed"
+
+        # Each task gets its own process so a timed out task can be killed
+        # without touching the others. Code objects are not picklable, but
+        # marshal round-trips them, so the child execs the validated code
+        # without recompiling it.
+        reader, writer = _MP_CONTEXT.Pipe(duplex=False)
+        process = _MP_CONTEXT.Process(
+            target=run_child, args=(marshal.dumps(code), writer), daemon=True
+        )
+        process.start()
+        writer.close()
+        try:
+            if not await asyncio.to_thread(reader.poll, task.timeout):
+                raise TimeoutError(f"Task exceeded {task.timeout}s")
+            try:
+                return reader.recv()
+            except EOFError:
+                await asyncio.to_thread(process.join)
+                return False, f"Worker exited with code {process.exitcode}"
+        finally:
+            if process.is_alive():
+                process.kill()
+            await asyncio.to_thread(process.join)
+            reader.close()
 
     async def _fetch_next_task(self) -> None | [Task]:
         return None
@@ -466,23 +880,27 @@ class CodexAgent:
         logger.info(f"Module {module_name} was reloaded - updating functionality")
 
 
+async def _amain(agent_config: CodexConfig) -> None:
+    agent = CodexAgent(agent_config)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # start() replaces the event, so resolve it when the signal arrives
+        loop.add_signal_handler(sig, lambda: agent._shutdown_event.set())
+    await agent.start()
+
+
 @hydra.main(config_path="conf", config_name="config")
 def main(cfg: DictConfig):
     agent_config = CodexConfig(**OmegaConf.to_container(cfg, resolve=True))
-    agent = CodexAgent(agent_config)
 
-    loop = asyncio.get_event_loop()
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, lambda: asyncio.create_task(agent.stop()))
+    if uvloop is not None:
+        # libuv-backed loop: cheaper socket polling for the RabbitMQ consumer
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     try:
-        loop.run_until_complete(agent.start())
+        asyncio.run(_amain(agent_config))
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
-    finally:
-        if loop.is_running():
-            loop.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+"""Child-process side of Codex task execution.
+
+Kept free of heavy imports: every task runs in its own short-lived process
+forked from the forkserver, which preloads only this module.
+"""
+
+import builtins
+import contextlib
+import io
+import marshal
+from multiprocessing.connection import Connection
+
+# Builtins visible to task code; everything that reaches the interpreter,
+# the filesystem or other modules is left out.
+SAFE_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in (
+        "abs",
+        "all",
+        "any",
+        "ArithmeticError",
+        "AssertionError",
+        "bool",
+        "bytes",
+        "chr",
+        "dict",
+        "divmod",
+        "enumerate",
+        "Exception",
+        "filter",
+        "float",
+        "format",
+        "frozenset",
+        "IndexError",
+        "int",
+        "isinstance",
+        "KeyError",
+        "len",
+        "list",
+        "map",
+        "max",
+        "min",
+        "ord",
+        "pow",
+        "print",
+        "range",
+        "repr",
+        "reversed",
+        "round",
+        "RuntimeError",
+        "set",
+        "slice",
+        "sorted",
+        "str",
+        "sum",
+        "tuple",
+        "TypeError",
+        "ValueError",
+        "zip",
+        "ZeroDivisionError",
+    )
+}
+
+
+def exec_code(code_bytes: bytes) -> tuple[bool, str]:
+    """Execute marshalled, already validated task code and capture stdout."""
+    stdout = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout):
+            exec(marshal.loads(code_bytes), {"__builtins__": SAFE_BUILTINS})
+        return True, stdout.getvalue() or "Execution successful"
+    except Exception as e:
+        return False, str(e)
+
+
+def run_child(code_bytes: bytes, conn: Connection) -> None:
+    """Process target: run the task and send ``(ok, output)`` back on *conn*."""
+    try:
+        conn.send(exec_code(code_bytes))
+    finally:
+        conn.close()
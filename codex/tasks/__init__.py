@@ -1,10 +1,16 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DEFAULT_TASKS_PATH = str(Path(__file__).with_name("tasks.yaml").resolve())
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Task:
     id: str
     title: str
@@ -14,7 +20,28 @@ class Task:
     estimated_minutes: int
 
 
-def load_tasks(path: str | Path = Path(__file__).with_name("tasks.yaml")) -> list[Task]:
-    with open(path, encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or []
-    return [Task(**item) for item in raw]
+_FIELDS = tuple(f.name for f in fields(Task))
+_FIELD_SET = frozenset(_FIELDS)
+
+
+def _make_task(item: dict) -> Task:
+    if item.keys() != _FIELD_SET:
+        unknown = sorted(item.keys() - _FIELD_SET)
+        missing = sorted(_FIELD_SET - item.keys())
+        raise TypeError(f"Invalid task entry: unknown={unknown}, missing={missing}")
+    # Positional construction skips keyword binding for every entry
+    return Task(*[item[f] for f in _FIELDS])
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> tuple[Task, ...]:
+    # mtime_ns and size only key the cache so edited files are re-parsed
+    # A single bytes buffer lets the parser detect the encoding itself
+    raw = yaml.load(Path(path).read_bytes(), Loader=_LOADER) or []
+    return tuple(_make_task(item) for item in raw)
+
+
+def load_tasks(path: str | Path = _DEFAULT_TASKS_PATH) -> list[Task]:
+    path = os.fspath(path)
+    st = os.stat(path)
+    return list(_load_cached(path, st.st_mtime_ns, st.st_size))
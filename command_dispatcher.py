@@ -1,17 +1,43 @@
 import asyncio
 import inspect
+import re
 import shlex
+import sys
+import time
 from dataclasses import dataclass
 from typing import Any, Callable, Tuple, Type, Union
 
 from loguru import logger
 from pydantic import BaseModel, ValidationError, ConfigDict
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
 # Custom types
 CommandResult = Union[Any, None]
 CommandHandler = Callable[..., CommandResult]
 ParamModel = Type[BaseModel]
 
+# Stored instead of field-less, extra="forbid" models: only an empty
+# parameter dict is valid, so pydantic does not need to run at all.
+_EMPTY_MODEL: Any = object()
+
+# --key[=value] and -k option tokens; anything else is not a parameter
+_LONG_OPT = re.compile(r"--([^=]+)(?:=(.*))?", re.DOTALL)
+_SHORT_OPT = re.compile(r"-([^-].*)", re.DOTALL)
+
+
+@dataclass(frozen=True, slots=True)
+class _Route:
+    """Everything dispatch needs for one command, resolved at registration."""
+
+    handler: CommandHandler
+    model: Any  # ParamModel, _EMPTY_MODEL or None
+    is_async: bool
+    accepts_context: bool
+
 
 @dataclass
 class CommandContext:
@@ -53,7 +79,7 @@ class CommandDispatcher:
     """
 
     EXIT = object()
-    _middlewares: list[Callable] = []
+
     class _ModuleModel(BaseModel):
         module: str
         model_config = ConfigDict(extra="forbid")
@@ -65,15 +91,46 @@ class CommandDispatcher:
         self, jarvis: Any | None = None, prefix: str = "", timeout: float = 30.0
     ) -> None:
         self.jarvis = jarvis
+        # (middleware, is_async) pairs, classified at registration
+        self._middlewares: list[tuple[Callable, bool]] = []
+        # Nested by module for listing; flat (module, action) routes for dispatch
         self._handlers: dict[str, dict[str | None, CommandHandler]] = {}
-        self._param_models: dict[str, dict[str | None, ParamModel]] = {}
+        self._routes: dict[tuple[str, str | None], _Route] = {}
+        # Rendered command listings, reset whenever a handler is registered
+        self._help_cache: str | None = None
+        self._listing_cache: tuple[str, str] | None = None  # (prefix, listing)
         self.prefix = prefix
         self.timeout = timeout
         self._register_builtins()
 
+    @staticmethod
+    def install_uvloop() -> bool:
+        """Use uvloop for event loops created after this call.
+
+        Returns ``True`` if uvloop is available and its policy was installed.
+        """
+        if uvloop is None or sys.platform == "win32":
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
+    @staticmethod
+    def configure_loop(loop: asyncio.AbstractEventLoop | None = None) -> bool:
+        """Install the eager task factory on *loop* (Python 3.12+).
+
+        Eager tasks run synchronously until their first suspension, so
+        handlers that finish without awaiting I/O skip a scheduler round-trip.
+        Returns ``False`` on interpreters without ``asyncio.eager_task_factory``.
+        """
+        factory = getattr(asyncio, "eager_task_factory", None)
+        if factory is None:
+            return False
+        (loop or asyncio.get_running_loop()).set_task_factory(factory)
+        return True
+
     def register_middleware(self, middleware: Callable):
         """Register preprocessing middleware"""
-        self._middlewares.append(middleware)
+        self._middlewares.append((middleware, asyncio.iscoroutinefunction(middleware)))
         return middleware
 
     def command(
@@ -101,16 +158,23 @@ class CommandDispatcher:
         param_model: ParamModel | None = None,
     ):
         """Register a command handler."""
+        # Interned keys let lookups of parsed (also interned) names hit on identity
+        module = sys.intern(module)
+        action = sys.intern(action) if action is not None else None
         if module not in self._handlers:
             self._handlers[module] = {}
-            self._param_models[module] = {}
 
+        self._help_cache = None
+        self._listing_cache = None
         self._handlers[module][action] = handler
-
-        if param_model:
-            self._param_models[module][action] = param_model
-        elif action in self._param_models.get(module, {}):
-            del self._param_models[module][action]
+        if param_model and self._is_empty_model(param_model):
+            param_model = _EMPTY_MODEL
+        self._routes[(module, action)] = _Route(
+            handler=handler,
+            model=param_model,
+            is_async=asyncio.iscoroutinefunction(handler),
+            accepts_context=self._inspect_accepts_context(handler),
+        )
 
     # ------------------------------------------------------------------
     # Compatibility helpers used by tests and modules
@@ -143,22 +207,24 @@ class CommandDispatcher:
             CommandExecutionError: For execution errors
         """
         # Apply middleware preprocessing
-        for middleware in self._middlewares:
-            text = await self._run_middleware(middleware, text)
+        if self._middlewares:
+            for middleware, is_async in self._middlewares:
+                text = await middleware(text) if is_async else middleware(text)
 
         try:
             module, action, params = self._parse_command(text)
-            handler = self._get_handler(module, action)
+            # One lookup yields the handler, its param model and call shape
+            route = self._routes.get((module, action))
 
-            if handler is None:
+            if route is None:
                 logger.debug(f"Command not found: {module} {action or ''}")
                 return None
 
-            ctx = self._create_context(text, handler)
-            validated_params = self._validate_params(module, action, params)
+            ctx = self._create_context(text, route)
+            validated_params = self._validate_params(route.model, params)
 
-            return await self._execute_handler(
-                handler=handler,
+            return await self._execute_route(
+                route=route,
                 params=validated_params,
                 context={**(context or {}), **ctx},
             )
@@ -169,8 +235,26 @@ class CommandDispatcher:
             logger.error(f"Command failed: {text}", exc_info=True)
             raise CommandExecutionError(f"Command execution failed: {e}", text) from e
 
-    async def dispatch_chain(self, commands: list[str]) -> list[CommandResult]:
-        """Execute multiple commands sequentially."""
+    async def dispatch_chain(
+        self, commands: list[str], *, parallel: bool = False
+    ) -> list[CommandResult]:
+        """Execute multiple commands, sequentially unless ``parallel`` is set.
+
+        With ``parallel=True`` the commands run concurrently via
+        :func:`asyncio.gather`. Use it only for independent commands: all of
+        them run to completion, so an ``exit`` does not stop the rest.
+        """
+        if parallel:
+            gathered = await asyncio.gather(
+                *(self.dispatch(cmd) for cmd in commands), return_exceptions=True
+            )
+            for item in gathered:
+                if isinstance(item, BaseException) and not isinstance(
+                    item, CommandError
+                ):
+                    raise item
+            return gathered
+
         results = []
         for cmd in commands:
             try:
@@ -185,13 +269,20 @@ class CommandDispatcher:
     def _parse_command(self, text: str) -> Tuple[str, str | None, dict[str, str]]:
         """Parse command string into components."""
         try:
-            tokens = shlex.split(text[len(self.prefix) :] if self.prefix else text)
+            body = text[len(self.prefix) :] if self.prefix else text
+            # Only quoting and escapes need shlex; plain input splits in C
+            if '"' in body or "'" in body or "\\" in body:
+                tokens = shlex.split(body)
+            else:
+                tokens = body.split()
             if not tokens:
                 raise InvalidCommandError("Empty command")
 
-            module = tokens[0]
+            module = sys.intern(tokens[0])
             action = (
-                tokens[1] if len(tokens) > 1 and not tokens[1].startswith("-") else None
+                sys.intern(tokens[1])
+                if len(tokens) > 1 and not tokens[1].startswith("-")
+                else None
             )
             params = self._parse_params(tokens[2:] if action else tokens[1:])
 
@@ -202,21 +293,20 @@ class CommandDispatcher:
     def _parse_params(self, tokens: list[str]) -> dict[str, str]:
         """Parse command parameters from tokens."""
         params = {}
+        count = len(tokens)
         i = 0
-        while i < len(tokens):
+        while i < count:
             token = tokens[i]
 
-            if token.startswith("--"):
+            match = _LONG_OPT.fullmatch(token)
+            if match:
                 # Long option (--key=value or --flag)
-                if "=" in token:
-                    key, val = token[2:].split("=", 1)
-                    params[key] = val
-                else:
-                    params[token[2:]] = "true"
-            elif token.startswith("-") and len(token) > 1:
+                key, val = match.groups()
+                params[key] = "true" if val is None else val
+            elif match := _SHORT_OPT.fullmatch(token):
                 # Short option (-k value or -v)
-                key = token[1:]
-                if i + 1 < len(tokens) and not tokens[i + 1].startswith("-"):
+                key = match[1]
+                if i + 1 < count and not tokens[i + 1].startswith("-"):
                     params[key] = tokens[i + 1]
                     i += 1
                 else:
@@ -232,52 +322,66 @@ class CommandDispatcher:
         self, module: str, action: str | None
     ) -> CommandHandler | None:
         """Get handler for command if exists."""
-        return self._handlers.get(module, {}).get(action)
-
-    def _validate_params(
-        self, module: str, action: str | None, params: dict[str, str]
-    ) -> dict[str, Any]:
-        """Validate parameters against model if available."""
-        model = self._param_models.get(module, {}).get(action)
-        if not model:
+        route = self._routes.get((module, action))
+        return route.handler if route is not None else None
+
+    def _validate_params(self, model: Any, params: dict[str, str]) -> dict[str, Any]:
+        """Validate parameters against the route's model if available."""
+        if model is None:
             return params
+        if model is _EMPTY_MODEL:
+            if params:
+                raise InvalidCommandError(
+                    f"Invalid parameters: unexpected {', '.join(params)}"
+                )
+            return {}
 
         try:
-            return model(**params).dict()
+            return model.model_validate(params).model_dump()
         except ValidationError as e:
             raise InvalidCommandError(f"Invalid parameters: {e}") from e
 
-    def _create_context(self, text: str, handler: CommandHandler) -> dict[str, Any]:
+    def _create_context(self, text: str, route: _Route) -> dict[str, Any]:
         """Create execution context."""
         return {
             "raw_input": text,
-            "is_async": asyncio.iscoroutinefunction(handler),
-            "timestamp": asyncio.get_event_loop().time(),
+            "is_async": route.is_async,
+            "timestamp": time.monotonic(),
         }
 
-    async def _execute_handler(
-        self, handler: CommandHandler, params: dict[str, Any], context: dict[str, Any]
+    async def _execute_route(
+        self, route: _Route, params: dict[str, Any], context: dict[str, Any]
     ) -> CommandResult:
-        """Execute handler with timeout and context injection."""
+        """Execute the route's handler with timeout and context injection."""
+        handler = route.handler
         # Inject context if handler accepts it
-        if "context" in inspect.signature(handler).parameters:
+        if route.accepts_context:
             params["context"] = context
 
+        if not route.is_async:
+            # Sync handlers cannot time out; call them directly
+            try:
+                return handler(**params)
+            except Exception:
+                logger.opt(exception=True).error("Handler execution failed")
+                raise
+
         try:
-            if asyncio.iscoroutinefunction(handler):
-                return await asyncio.wait_for(handler(**params), timeout=self.timeout)
-            return handler(**params)
+            async with asyncio.timeout(self.timeout):
+                return await handler(**params)
         except asyncio.TimeoutError:
             raise CommandExecutionError("Command timed out")
         except Exception:
             logger.opt(exception=True).error("Handler execution failed")
             raise
 
-    async def _run_middleware(self, middleware: Callable, text: str) -> str:
-        """Run middleware with proper async/sync handling."""
-        if asyncio.iscoroutinefunction(middleware):
-            return await middleware(text)
-        return middleware(text)
+    @staticmethod
+    def _is_empty_model(model: ParamModel) -> bool:
+        return not model.model_fields and model.model_config.get("extra") == "forbid"
+
+    @staticmethod
+    def _inspect_accepts_context(handler: CommandHandler) -> bool:
+        return "context" in inspect.signature(handler).parameters
 
     def _register_builtins(self):
         """Register built-in commands."""
@@ -322,20 +426,26 @@ class CommandDispatcher:
                 return f"No help available for: {command}"
             return inspect.getdoc(handler) or "No documentation available"
 
-        return "\n".join(
-            f"{mod} {act if act else ''}"
-            for mod in self._handlers
-            for act in self._handlers[mod]
-        )
+        if self._help_cache is None:
+            self._help_cache = "\n".join(
+                f"{mod} {act if act else ''}"
+                for mod in self._handlers
+                for act in self._handlers[mod]
+            )
+        return self._help_cache
 
     def _list_commands(self) -> str:
         """List all registered commands."""
-        cmds = [
+        cached = self._listing_cache
+        if cached is not None and cached[0] == self.prefix:
+            return cached[1]
+        listing = "\n".join(
             f"{self.prefix}{mod} {act if act else ''}".rstrip()
             for mod in self._handlers
             for act in self._handlers[mod]
-        ]
-        return "\n".join(cmds)
+        )
+        self._listing_cache = (self.prefix, listing)
+        return listing
 
 
 # Global dispatcher instance
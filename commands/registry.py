@@ -14,6 +14,7 @@ Example::
 
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -26,158 +27,182 @@ class CommandCategory(Enum):
     UTILITY = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandInfo:
     name: str
     description: str
     category: CommandCategory
     usage: str
-    aliases: list[str] = None
+    aliases: tuple[str, ...] = ()
 
 
-CORE_COMMANDS = [
+CORE_COMMANDS = (
     CommandInfo(
         name="help",
         description="Показывает справку по командам",
         category=CommandCategory.CORE,
         usage="help [команда]",
-        aliases=["помощь", "справка"],
+        aliases=("помощь", "справка"),
     ),
     CommandInfo(
         name="exit",
         description="Завершает работу Jarvis",
         category=CommandCategory.CORE,
         usage="exit",
-        aliases=["выход", "завершение"],
+        aliases=("выход", "завершение"),
     ),
-]
+)
 
-VOICE_COMMANDS = [
+VOICE_COMMANDS = (
     CommandInfo(
         name="voice_on",
         description="Включает голосовой режим",
         category=CommandCategory.VOICE,
         usage="voice_on",
-        aliases=["включи голос"],
+        aliases=("включи голос",),
     ),
     CommandInfo(
         name="voice_off",
         description="Выключает голосовой режим",
         category=CommandCategory.VOICE,
         usage="voice_off",
-        aliases=["выключи голос"],
+        aliases=("выключи голос",),
     ),
     CommandInfo(
         name="change_voice",
         description="Изменяет параметры голоса",
         category=CommandCategory.VOICE,
         usage="change_voice [скорость] [громкость]",
-        aliases=["измени голос"],
+        aliases=("измени голос",),
     ),
     CommandInfo(
         name="set_language",
         description="Change voice recognition and synthesis language",
         category=CommandCategory.VOICE,
         usage="set_language <code>",
-        aliases=[],
+        aliases=(),
     ),
-]
+)
 
-DEVEL_COMMANDS = [
+DEVEL_COMMANDS = (
     CommandInfo(
         name="lint",
         description="Run AST linter on a file or directory",
         category=CommandCategory.DEVELOPMENT,
         usage="lint <path> [--max-lines N]",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="self_review",
         description="Review recent generated code for lint issues",
         category=CommandCategory.DEVELOPMENT,
         usage="self_review",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="repl",
         description="Запускает интерактивный Python REPL",
         category=CommandCategory.DEVELOPMENT,
         usage="repl",
-        aliases=["python"],
+        aliases=("python",),
     ),
     CommandInfo(
         name="code_tips",
         description="Provide code improvement suggestions",
         category=CommandCategory.DEVELOPMENT,
         usage="code_tips <path> [--max-lines N]",
-        aliases=["tips", "советы"],
+        aliases=("tips", "советы"),
     ),
     CommandInfo(
         name="rate_solutions",
         description="Show ratings of stored solutions",
         category=CommandCategory.DEVELOPMENT,
         usage="rate_solutions",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="self_update",
         description="Update Jarvis source via Git",
         category=CommandCategory.DEVELOPMENT,
         usage="self_update <commit|pull> ...",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="check_updates",
         description="Check for newer version in remote repository",
         category=CommandCategory.DEVELOPMENT,
         usage="check_updates [remote] [branch]",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="run_with_retry",
         description="Run a script with syntax check and retry",
         category=CommandCategory.DEVELOPMENT,
         usage="run_with_retry <script.py>",
-        aliases=[],
+        aliases=(),
     ),
-]
+)
 
-UTILITY_COMMANDS = [
+UTILITY_COMMANDS = (
     CommandInfo(
         name="set_goal",
         description="Set an active goal with optional motivation",
         category=CommandCategory.UTILITY,
         usage="set_goal <goal> [motivation]",
-        aliases=["goal"],
+        aliases=("goal",),
     ),
     CommandInfo(
         name="execute_goal",
         description="Execute actions for the current goal",
         category=CommandCategory.UTILITY,
         usage="execute_goal",
-        aliases=["run_goal"],
+        aliases=("run_goal",),
     ),
     CommandInfo(
         name="add_goal",
         description="Add a goal with priority",
         category=CommandCategory.UTILITY,
         usage="add_goal <priority> <goal> [--deadline TS] [--source SRC] [--motivation TEXT]",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="list_goals",
         description="list active goals",
         category=CommandCategory.UTILITY,
         usage="list_goals",
-        aliases=[],
+        aliases=(),
     ),
     CommandInfo(
         name="remove_goal",
         description="Remove a goal by index",
         category=CommandCategory.UTILITY,
         usage="remove_goal <index>",
-        aliases=[],
+        aliases=(),
     ),
-]
+)
 
-ALL_COMMANDS = CORE_COMMANDS + VOICE_COMMANDS + DEVEL_COMMANDS + UTILITY_COMMANDS
+ALL_COMMANDS: tuple[CommandInfo, ...] = (
+    CORE_COMMANDS + VOICE_COMMANDS + DEVEL_COMMANDS + UTILITY_COMMANDS
+)
+
+# Every lower-cased command name and alias mapped to its CommandInfo
+COMMAND_INDEX: dict[str, CommandInfo] = {}
+
+
+def _build_index() -> None:
+    COMMAND_INDEX.clear()
+    for info in ALL_COMMANDS:
+        COMMAND_INDEX[sys.intern(info.name.lower())] = info
+        for alias in info.aliases:
+            COMMAND_INDEX.setdefault(sys.intern(alias.lower()), info)
+
+
+def lookup(name: str) -> CommandInfo | None:
+    """Return the command registered under ``name`` or one of its aliases.
+
+    Matching is case-insensitive.
+    """
+    return COMMAND_INDEX.get(name.lower())
+
+
+_build_index()
@@ -1,44 +1,81 @@
 import threading
-import time
-from typing import Any, Tuple
+from collections import OrderedDict
+from time import monotonic as _now
+from typing import Any
 
 
 class ContextCache:
-    """Thread-safe in-memory cache with TTL support."""
+    """Thread-safe in-memory LRU cache with TTL support.
 
-    def __init__(self, max_size: int = 1000) -> None:
-        self.store: dict[str, Tuple[Any, float]] = {}
-        self.lock = threading.Lock()
+    Entries are spread over ``shards`` independently locked sub-caches so
+    threads working on unrelated keys do not contend. Capacity and LRU order
+    are tracked per shard: each shard holds ``ceil(max_size / shards)``
+    entries, so total capacity is at least ``max_size``, but a shard that
+    receives more than its share of keys evicts before the cache as a whole
+    is full. TTLs are measured on the monotonic clock, so
+    wall-clock adjustments do not expire or revive entries.
+    """
+
+    __slots__ = (
+        "_mask",
+        "_shards",
+        "_locks",
+        "max_size",
+        "shard_size",
+        "_low_watermark",
+    )
+
+    def __init__(self, max_size: int = 1000, shards: int = 16) -> None:
+        # Power-of-two shard count, never more shards than entries
+        count = 1
+        while count * 2 <= min(shards, max_size):
+            count *= 2
+        self._mask = count - 1
+        self._shards: list[OrderedDict[str, tuple[Any, float]]] = [
+            OrderedDict() for _ in range(count)
+        ]
+        self._locks = [threading.Lock() for _ in range(count)]
         self.max_size = max_size
+        self.shard_size = max(1, -(-max_size // count))
+        # A full shard is trimmed by ~10% at once rather than one per insert
+        self._low_watermark = self.shard_size - self.shard_size // 10
+
+    def _shard(
+        self, key: str
+    ) -> tuple[threading.Lock, OrderedDict[str, tuple[Any, float]]]:
+        i = hash(key) & self._mask
+        return self._locks[i], self._shards[i]
 
     def set(self, key: str, value: Any, ttl: float = 60) -> None:
         """Store *value* under *key* for *ttl* seconds."""
-        with self.lock:
-            if len(self.store) >= self.max_size:
-                self._evict()
-            self.store[key] = (value, time.time() + ttl)
+        lock, store = self._shard(key)
+        with lock:
+            store[key] = (value, _now() + ttl)
+            store.move_to_end(key)
+            if len(store) > self.shard_size:
+                low = self._low_watermark
+                while len(store) > low:
+                    store.popitem(last=False)
 
     def get(self, key: str) -> Any | None:
         """Return cached value for *key* if not expired."""
-        with self.lock:
-            item = self.store.get(key)
+        lock, store = self._shard(key)
+        with lock:
+            item = store.get(key)
             if not item:
                 return None
             value, expire_at = item
-            if time.time() > expire_at:
-                del self.store[key]
+            if _now() > expire_at:
+                del store[key]
                 return None
+            store.move_to_end(key)
             return value
 
-    def _evict(self) -> None:
-        """Remove the oldest cached item."""
-        if self.store:
-            self.store.pop(next(iter(self.store)))
-
     def clear(self) -> None:
         """Clear all cached entries."""
-        with self.lock:
-            self.store.clear()
+        for lock, store in zip(self._locks, self._shards, strict=True):
+            with lock:
+                store.clear()
 
 
 context_cache = ContextCache()
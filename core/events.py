@@ -13,10 +13,17 @@ def register_event_emitter(emitter: Callable[[str, Any], None]) -> None:
 
 
 def emit_event(event_name: str, data: Any) -> None:
-    if _emitter:
-        try:
-            _emitter(event_name, data)
-        except Exception:  # pragma: no cover - best effort logging
-            logger.exception("Event emitter failed for %s", event_name)
-    else:
-        logger.info("Event %s: %s", event_name, data)
+    """Pass an event to the registered emitter.
+
+    Without an emitter the event is only logged at DEBUG level, so callers
+    should avoid building expensive *data* just to emit it.
+    """
+    emitter = _emitter
+    if emitter is None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event %s: %s", event_name, data)
+        return
+    try:
+        emitter(event_name, data)
+    except Exception:  # pragma: no cover - best effort logging
+        logger.exception("Event emitter failed for %s", event_name)
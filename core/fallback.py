@@ -1,17 +1,26 @@
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any, Callable
 
 
 class FallbackManager:
     """Manage optional fallbacks for callable execution."""
 
+    __slots__ = ("_fallbacks",)
+
     def __init__(self) -> None:
         self._fallbacks: dict[str, Callable[..., Any]] = {}
 
     def register(self, name: str, func: Callable[..., Any]) -> None:
         """Register *func* as fallback under *name*."""
-        self._fallbacks[name] = func
+        # Copy-on-write: readers always see a complete, never-mutated dict
+        self._fallbacks = {**self._fallbacks, name: func}
+
+    @property
+    def fallbacks(self) -> Mapping[str, Callable[..., Any]]:
+        """Read-only view of the registered fallbacks."""
+        return MappingProxyType(self._fallbacks)
 
     async def execute(
         self,
@@ -1,4 +1,5 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Mapping
+from types import MappingProxyType
 from typing import Callable
 
 from core.events import emit_event
@@ -8,6 +9,8 @@ from utils.logger import get_logger
 class FallbackManager:
     """Manage fallback handlers for Jarvis modules."""
 
+    __slots__ = ("_handlers", "_logger")
+
     def __init__(self) -> None:
         self._handlers: dict[str, Callable[[Exception], Awaitable[None]]] = {}
         self._logger = get_logger().getChild("FallbackManager")
@@ -16,9 +19,15 @@ class FallbackManager:
         self, module_name: str, handler: Callable[[Exception], Awaitable[None]]
     ) -> None:
         """Register an async *handler* for *module_name*."""
-        self._handlers[module_name] = handler
+        # Copy-on-write: readers always see a complete, never-mutated dict
+        self._handlers = {**self._handlers, module_name: handler}
         self._logger.debug("Registered fallback for %s", module_name)
 
+    @property
+    def handlers(self) -> Mapping[str, Callable[[Exception], Awaitable[None]]]:
+        """Read-only view of the registered fallback handlers."""
+        return MappingProxyType(self._handlers)
+
     async def activate(self, module_name: str, exc: Exception) -> None:
         """Execute fallback handler for *module_name* if available."""
         handler = self._handlers.get(module_name)
@@ -1,6 +1,6 @@
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from core.events import emit_event
 
@@ -8,11 +8,13 @@ from core.events import emit_event
 class FlagManager:
     """Track module anomalies and flag problematic modules."""
 
+    __slots__ = ("error_threshold", "window", "flags", "_errors")
+
     def __init__(self, error_threshold: int = 3, window: float = 60.0) -> None:
         self.error_threshold = error_threshold
         self.window = window
         self.flags: dict[str, str] = {}
-        self._errors: dict[str, list[float]] = defaultdict(list)
+        self._errors: dict[str, deque[float]] = defaultdict(deque)
 
     def flag(self, module_name: str, reason: str) -> None:
         """Mark *module_name* as flagged for *reason*."""
@@ -30,9 +32,12 @@ class FlagManager:
 
     def record_error(self, module_name: str, error: Exception) -> None:
         """Record an exception for *module_name* and flag if threshold exceeded."""
-        now = time.time()
+        now = time.monotonic()
         history = self._errors[module_name]
-        history[:] = [t for t in history if now - t < self.window]
+        # Timestamps are appended in order, so expired ones sit at the left
+        cutoff = now - self.window
+        while history and history[0] <= cutoff:
+            history.popleft()
         history.append(now)
         if len(history) >= self.error_threshold:
             self.flag(module_name, f"Error threshold exceeded: {error}")
@@ -1,56 +1,63 @@
 import asyncio
 import time
-from collections import defaultdict
 from functools import wraps
 from typing import Any, Callable
 
-module_stats: dict[str, dict[str, Any]] = defaultdict(
-    lambda: {"calls": 0, "errors": 0, "avg_duration": 0.0}
-)
+module_stats: dict[str, dict[str, Any]] = {}
+
+_perf_counter = time.perf_counter
+
+
+def _stat(module_name: str) -> dict[str, Any]:
+    stat = module_stats.get(module_name)
+    if stat is None:
+        stat = module_stats.setdefault(
+            module_name, {"calls": 0, "errors": 0, "avg_duration": 0.0}
+        )
+    return stat
+
+
+def _record_call(stat: dict[str, Any], duration: float) -> None:
+    calls = stat["calls"] + 1
+    stat["calls"] = calls
+    # Incremental mean: no need to rebuild the running total
+    stat["avg_duration"] += (duration - stat["avg_duration"]) / calls
 
 
 def track_usage(module_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator tracking calls, duration and errors for a module."""
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Resolved once; the wrappers update this dict directly
+        stat = _stat(module_name)
+
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start = time.time()
+                start = _perf_counter()
                 try:
                     result = await func(*args, **kwargs)
-                    duration = time.time() - start
-                    stat = module_stats[module_name]
-                    stat["calls"] += 1
-                    stat["avg_duration"] = (
-                        (stat["avg_duration"] * (stat["calls"] - 1)) + duration
-                    ) / stat["calls"]
-                    return result
                 except Exception:
-                    module_stats[module_name]["errors"] += 1
+                    stat["errors"] += 1
                     raise
+                _record_call(stat, _perf_counter() - start)
+                return result
 
             return async_wrapper
-        else:
 
-            @wraps(func)
-            def wrapper(*args: Any, **kwargs: Any) -> Any:
-                start = time.time()
-                try:
-                    result = func(*args, **kwargs)
-                    duration = time.time() - start
-                    stat = module_stats[module_name]
-                    stat["calls"] += 1
-                    stat["avg_duration"] = (
-                        (stat["avg_duration"] * (stat["calls"] - 1)) + duration
-                    ) / stat["calls"]
-                    return result
-                except Exception:
-                    module_stats[module_name]["errors"] += 1
-                    raise
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = _perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                stat["errors"] += 1
+                raise
+            _record_call(stat, _perf_counter() - start)
+            return result
 
-            return wrapper
+        return wrapper
 
     return decorator
 
@@ -40,13 +40,13 @@ def run_server(host: str = "localhost", port: int = 8765) -> None:
 
 def broadcast_metrics(data: dict[str, Any]) -> None:
     """Send a metrics update to all connected clients."""
-    if _loop is None or not connected_clients:
+    if _loop is None:
+        return
+    # Snapshot first so the set cannot change between the check and the send
+    clients = tuple(connected_clients)
+    if not clients:
         return
     msg = json.dumps(data)
-
-    async def _broadcast() -> None:
-        await asyncio.gather(
-            *[ws.send(msg) for ws in connected_clients], return_exceptions=True
-        )
-
-    asyncio.run_coroutine_threadsafe(_broadcast(), _loop)
+    # websockets.broadcast encodes the frame once and writes it to every
+    # client without a coroutine per connection; it must run on the loop
+    _loop.call_soon_threadsafe(websockets.broadcast, clients, msg)
@@ -1,14 +1,31 @@
 from typing import Any, Callable
 
 _supplier: Callable[[], list[Any]] | None = None
+# Last supplier result; rebuilt lazily after invalidation
+_snapshot: tuple[Any, ...] | None = None
+_version = 0
 
 
 def register_module_supplier(func: Callable[[], list[Any]]) -> None:
     global _supplier
     _supplier = func
+    invalidate_active_modules()
 
 
-def get_active_modules() -> list[Any]:
-    if _supplier:
-        return _supplier()
-    return []
+def invalidate_active_modules() -> None:
+    """Drop the cached module snapshot after the active set changes."""
+    global _snapshot, _version
+    _version += 1
+    _snapshot = None
+
+
+def get_active_modules() -> tuple[Any, ...]:
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None:
+        version = _version
+        snapshot = tuple(_supplier() or ()) if _supplier else ()
+        # Only publish if nothing was invalidated while the supplier ran
+        if version == _version:
+            _snapshot = snapshot
+    return snapshot
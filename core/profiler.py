@@ -1,61 +1,131 @@
 import asyncio
 import logging
+import threading
 import time
 import tracemalloc
 from contextlib import asynccontextmanager
+from functools import wraps
 from typing import Any, Callable
 
+_perf_counter = time.perf_counter
+
 
 class ModuleProfiler:
-    """Simple profiler for Jarvis modules."""
+    """Simple profiler for Jarvis modules.
+
+    ``sample_rate`` profiles one call in N per decorated function (the first
+    call is always profiled); the rest run without instrumentation. With
+    ``trace_memory=False`` only wall time is measured, which avoids the cost
+    of tracing every allocation while the profiled code runs.
+
+    Overlapping profiled calls share one tracemalloc session, so each of them
+    reports the peak reached since the first of them started.
+    """
+
+    __slots__ = (
+        "stats",
+        "sample_rate",
+        "trace_memory",
+        "_calls",
+        "_trace_lock",
+        "_active_traces",
+        "_owns_trace",
+    )
 
-    def __init__(self) -> None:
+    def __init__(self, sample_rate: int = 1, trace_memory: bool = True) -> None:
         self.stats: dict[str, dict[str, Any]] = {}
+        self.sample_rate = max(1, sample_rate)
+        self.trace_memory = trace_memory
+        self._calls: dict[tuple[str, str], int] = {}
+        self._trace_lock = threading.Lock()
+        self._active_traces = 0
+        self._owns_trace = False
 
     def profile(
         self, module_name: str, func_name: str
     ) -> Callable[[Callable], Callable]:
         """Decorator to profile a module method."""
+        key = (module_name, func_name)
 
         def decorator(func: Callable) -> Callable:
             if asyncio.iscoroutinefunction(func):
 
+                @wraps(func)
                 async def async_wrapper(*args, **kwargs):
-                    tracemalloc.start()
-                    start_time = time.perf_counter()
-                    result = await func(*args, **kwargs)
-                    elapsed = time.perf_counter() - start_time
-                    _current, peak = tracemalloc.get_traced_memory()
-                    tracemalloc.stop()
-                    self._record(module_name, func_name, elapsed, peak)
-                    return result
+                    if not self._sampled(key):
+                        return await func(*args, **kwargs)
+                    started = self._start_trace()
+                    start_time = _perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        elapsed = _perf_counter() - start_time
+                        peak = self._stop_trace(started)
+                        self._record(module_name, func_name, elapsed, peak)
 
                 return async_wrapper
 
+            @wraps(func)
             def sync_wrapper(*args, **kwargs):
-                tracemalloc.start()
-                start_time = time.perf_counter()
-                result = func(*args, **kwargs)
-                elapsed = time.perf_counter() - start_time
-                _current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
-                self._record(module_name, func_name, elapsed, peak)
-                return result
+                if not self._sampled(key):
+                    return func(*args, **kwargs)
+                started = self._start_trace()
+                start_time = _perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    elapsed = _perf_counter() - start_time
+                    peak = self._stop_trace(started)
+                    self._record(module_name, func_name, elapsed, peak)
 
             return sync_wrapper
 
         return decorator
 
-    def _record(self, module: str, func: str, elapsed: float, peak: int) -> None:
-        self.stats.setdefault(module, {})[func] = {
-            "time_seconds": round(elapsed, 4),
-            "peak_memory_kb": peak // 1024,
-        }
-        if elapsed > 1.0 or peak > 10 * 1024 * 1024:
-            logging.warning(
-                f"[Profiler] {module}.{func} took {elapsed:.2f}s, "
-                f"peak memory {peak // 1024} KB"
-            )
+    def _sampled(self, key: tuple[str, str]) -> bool:
+        count = self._calls.get(key, 0)
+        self._calls[key] = count + 1
+        return count % self.sample_rate == 0
+
+    def _start_trace(self) -> bool:
+        """Join the shared tracemalloc session, starting it if needed.
+
+        Returns whether memory is being traced for this call.
+        """
+        if not self.trace_memory:
+            return False
+        with self._trace_lock:
+            if self._active_traces == 0:
+                # Only reset the peak when no other profiled call is running
+                if tracemalloc.is_tracing():
+                    tracemalloc.reset_peak()
+                    self._owns_trace = False
+                else:
+                    tracemalloc.start()
+                    self._owns_trace = True
+            self._active_traces += 1
+        return True
+
+    def _stop_trace(self, started: bool) -> int | None:
+        """Return the traced peak; the last call out stops our session."""
+        if not started:
+            return None
+        with self._trace_lock:
+            _current, peak = tracemalloc.get_traced_memory()
+            self._active_traces -= 1
+            if self._active_traces == 0 and self._owns_trace:
+                tracemalloc.stop()
+                self._owns_trace = False
+        return peak
+
+    def _record(self, module: str, func: str, elapsed: float, peak: int | None) -> None:
+        entry: dict[str, Any] = {"time_seconds": round(elapsed, 4)}
+        if peak is not None:
+            entry["peak_memory_kb"] = peak // 1024
+        self.stats.setdefault(module, {})[func] = entry
+        if elapsed > 1.0 or (peak or 0) > 10 * 1024 * 1024:
+            memory = f", peak memory {peak // 1024} KB" if peak is not None else ""
+            logging.warning(f"[Profiler] {module}.{func} took {elapsed:.2f}s{memory}")
 
     def get_stats(self) -> dict[str, dict[str, Any]]:
         return self.stats
@@ -63,15 +133,15 @@ class ModuleProfiler:
     @asynccontextmanager
     async def profile_block(self, module: str, label: str):
         """Async context manager to profile arbitrary blocks."""
-        tracemalloc.start()
-        start_time = time.perf_counter()
+        started = self._start_trace()
+        start_time = _perf_counter()
         try:
             yield
         finally:
-            elapsed = time.perf_counter() - start_time
-            _current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
+            elapsed = _perf_counter() - start_time
+            peak = self._stop_trace(started)
             self._record(module, label, elapsed, peak)
 
 
-default_profiler = ModuleProfiler()
+# Module methods are wrapped for every call, so only one in 100 is measured
+default_profiler = ModuleProfiler(sample_rate=100)
@@ -1,41 +1,59 @@
 import ast
+import hashlib
+import json
 import os
 from collections.abc import Iterable
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List
 
-import yaml
-
-from utils.docstring_helper import _indent_lines
+from utils.docstring_helper import _indent_lines, _load_style
+from utils.fs import iter_py_files
 
 PLACEHOLDER = "Auto-generated summary."
+FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+CACHE_DIR = ".jarvis_doc_cache"
+# Least recently used entries beyond this count are dropped after a run
+CACHE_MAX_ENTRIES = 1000
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 64
 
 
-def _load_style(policy_path: str | os.PathLike[str]) -> str:
-    path = Path(policy_path)
-    if not path.is_file():
-        return "google"
-    try:
-        with open(path, encoding="utf-8") as fh:
-            cfg = yaml.safe_load(fh) or {}
-            return cfg.get("docstring", {}).get("style", "google")
-    except Exception:
-        return "google"
+def _existing_doc(node: ast.Module | ast.ClassDef | ast.FunctionDef) -> str | None:
+    """Return the raw docstring of ``node`` without ``ast.get_docstring``."""
+    first = node.body[0] if node.body else None
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return first.value.value
+    return None
 
 
 def _is_placeholder(doc: str | None) -> bool:
-    if not doc:
-        return False
-    return doc.strip().startswith(PLACEHOLDER)
+    return doc is not None and doc.lstrip().startswith(PLACEHOLDER)
+
+
+def _classify(
+    tree: ast.Module,
+) -> tuple[list[str], list[str], list[ast.ClassDef | ast.FunctionDef]]:
+    """Split top-level definitions into class names, function names and nodes."""
+    classes: list[str] = []
+    funcs: list[str] = []
+    targets: list[ast.ClassDef | ast.FunctionDef] = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes.append(node.name)
+        elif isinstance(node, FUNC_TYPES):
+            funcs.append(node.name)
+        else:
+            continue
+        targets.append(node)
+    return classes, funcs, targets
 
 
-def _summary_for_module(tree: ast.Module, path: str) -> str:
-    classes = [n.name for n in tree.body if isinstance(n, ast.ClassDef)]
-    funcs = [
-        n.name
-        for n in tree.body
-        if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-    ]
+def _summary_for_module(classes: list[str], funcs: list[str], path: str) -> str:
     parts = []
     if classes:
         parts.append(f"classes: {', '.join(classes)}")
@@ -48,11 +66,7 @@ def _summary_for_module(tree: ast.Module, path: str) -> str:
 
 
 def _summary_for_class(node: ast.ClassDef) -> str:
-    methods = [
-        n.name
-        for n in node.body
-        if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-    ]
+    methods = [n.name for n in node.body if isinstance(n, FUNC_TYPES)]
     if methods:
         return f"Class {node.name} with methods: {', '.join(methods)}."
     return f"Class {node.name}."
@@ -67,85 +81,181 @@ def _summary_for_function(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
 
 def _docstring_lines(text: str, indent: str, style: str) -> list[str]:
     quotes = '"""'
+    if "\n" not in text:
+        # Generated summaries are one-liners; skip the split-and-indent pass
+        return [f"{indent}{quotes}{text}{quotes}"]
     return _indent_lines(f"{quotes}{text}{quotes}", indent)
 
 
-def enhance_file(
-    path: str,
-    style: str | None = None,
-    policy_path: str | os.PathLike[str] = "train/coding_policy.yaml",
-) -> bool:
-    if style is None:
-        style = _load_style(policy_path)
-    with open(path, encoding="utf-8") as f:
-        source = f.read()
+def _cache_key(source: str, path: str, style: str) -> str:
+    # The module summary falls back to the file name, so it is part of the key
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{style}\0{os.path.basename(path)}\0".encode())
+    digest.update(source.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def _load_cached_edits(
+    cache_dir: str | os.PathLike[str], key: str
+) -> list[tuple[int, int, list[str]]] | None:
+    target = os.path.join(cache_dir, key)
+    try:
+        with open(target, encoding="utf-8") as f:
+            edits = [(start, end, lines) for start, end, lines in json.load(f)]
+        # The mtime doubles as the last-use time for _prune_cache
+        os.utime(target)
+        return edits
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_edits(
+    cache_dir: str | os.PathLike[str],
+    key: str,
+    edits: list[tuple[int, int, list[str]]],
+) -> None:
+    target = os.path.join(cache_dir, key)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(edits, f)
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+def _prune_cache(
+    cache_dir: str | os.PathLike[str], max_entries: int = CACHE_MAX_ENTRIES
+) -> None:
+    """Delete the least recently used cache entries beyond ``max_entries``."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_mtime_ns, e.path) for e in it if e.is_file()]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _compute_edits(
+    source: str, path: str, style: str
+) -> list[tuple[int, int, list[str]]]:
     tree = ast.parse(source, filename=path)
     lines = source.splitlines()
-    updated = False
+    classes, funcs, targets = _classify(tree)
+    # (start, end, replacement) against the original line indices; applied
+    # in one pass at the end so earlier edits never shift later positions
+    edits: list[tuple[int, int, list[str]]] = []
 
-    module_doc = ast.get_docstring(tree, clean=False)
-    first = tree.body[0] if tree.body else None
+    module_doc = _existing_doc(tree)
     if module_doc is None or _is_placeholder(module_doc):
-        summary = _summary_for_module(tree, path)
+        summary = _summary_for_module(classes, funcs, path)
         doc_lines = _docstring_lines(summary, "", style)
         if module_doc is None:
             insert_idx = 1 if lines and lines[0].startswith("#!") else 0
-            lines[insert_idx:insert_idx] = doc_lines
-        elif isinstance(first, ast.Expr) and isinstance(
-            getattr(first, "value", None), ast.Str
-        ):
+            edits.append((insert_idx, insert_idx, doc_lines))
+        else:
+            first = tree.body[0]
             start = first.lineno - 1
             end = first.end_lineno or start + 1
-            lines[start:end] = doc_lines
-        updated = True
+            edits.append((start, end, doc_lines))
 
-    for node in tree.body:
-        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
-            doc = ast.get_docstring(node, clean=False)
-            body_first = node.body[0] if node.body else None
-            if doc is None or _is_placeholder(doc):
-                if isinstance(node, ast.ClassDef):
-                    summary = _summary_for_class(node)
-                else:
-                    summary = _summary_for_function(node)
-                indent = " " * (node.col_offset + 4)
-                new_lines = _docstring_lines(summary, indent, style)
-                if doc is None:
-                    insert_at = body_first.lineno - 1 if body_first else node.lineno
-                    lines[insert_at:insert_at] = new_lines
-                elif isinstance(body_first, ast.Expr) and isinstance(
-                    getattr(body_first, "value", None), ast.Str
-                ):
-                    start = body_first.lineno - 1
-                    end = body_first.end_lineno or start + 1
-                    lines[start:end] = new_lines
-                updated = True
-
-    if updated:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-    return updated
+    for node in targets:
+        doc = _existing_doc(node)
+        body_first = node.body[0] if node.body else None
+        if doc is None or _is_placeholder(doc):
+            if isinstance(node, ast.ClassDef):
+                summary = _summary_for_class(node)
+            else:
+                summary = _summary_for_function(node)
+            indent = " " * (node.col_offset + 4)
+            new_lines = _docstring_lines(summary, indent, style)
+            if doc is None:
+                insert_at = body_first.lineno - 1 if body_first else node.lineno
+                edits.append((insert_at, insert_at, new_lines))
+            else:
+                start = body_first.lineno - 1
+                end = body_first.end_lineno or start + 1
+                edits.append((start, end, new_lines))
+    return edits
+
+
+def enhance_file(
+    path: str,
+    style: str | None = None,
+    policy_path: str | os.PathLike[str] = "train/coding_policy.yaml",
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> bool:
+    """Add or refresh generated docstrings in ``path``.
+
+    With ``cache_dir`` set, the edit list is stored under a hash of the
+    source, style and file name, so re-running on an unchanged file skips
+    ``ast.parse`` entirely.
+    """
+    if style is None:
+        style = _load_style(policy_path)
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    key = _cache_key(source, path, style) if cache_dir is not None else None
+    edits = _load_cached_edits(cache_dir, key) if key else None
+    if edits is None:
+        edits = _compute_edits(source, path, style)
+        if key:
+            _store_cached_edits(cache_dir, key, edits)
+    if not edits:
+        return False
+
+    lines = source.splitlines()
+    out: list[str] = []
+    cursor = 0
+    for start, end, new_lines in sorted(edits, key=lambda edit: edit[0]):
+        out.extend(lines[cursor:start])
+        out.extend(new_lines)
+        cursor = end
+    out.extend(lines[cursor:])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+    return True
 
 
 def enhance_paths(
     paths: Iterable[str],
     style: str | None = None,
     policy_path: str | os.PathLike[str] = "train/coding_policy.yaml",
+    cache_dir: str | os.PathLike[str] | None = None,
 ) -> list[str]:
-    changed: list[str] = []
+    files: list[str] = []
     for p in paths:
         if os.path.isdir(p):
-            for root, _, files in os.walk(p):
-                for fname in files:
-                    if fname.endswith(".py"):
-                        fpath = os.path.join(root, fname)
-                        if enhance_file(fpath, style, policy_path):
-                            changed.append(fpath)
+            files.extend(entry.path for entry in iter_py_files(p))
         else:
             if p.endswith(".py") and os.path.isfile(p):
-                if enhance_file(p, style, policy_path):
-                    changed.append(p)
-    return changed
+                files.append(p)
+
+    if style is None:
+        style = _load_style(policy_path)
+    worker = partial(
+        enhance_file, style=style, policy_path=policy_path, cache_dir=cache_dir
+    )
+    if len(files) < PARALLEL_MIN_FILES:
+        results = list(map(worker, files))
+    else:
+        # ast.parse dominates and is CPU-bound, so spread files over processes
+        workers = min(len(files), os.cpu_count() or 1)
+        # About four chunks per worker balances load against IPC overhead
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(worker, files, chunksize=chunksize))
+    if cache_dir is not None:
+        _prune_cache(cache_dir)
+    return [fpath for fpath, changed in zip(files, results, strict=True) if changed]
 
 
 if __name__ == "__main__":
@@ -160,8 +270,18 @@ if __name__ == "__main__":
         default="train/coding_policy.yaml",
         help="Path to coding policy YAML file",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=CACHE_DIR,
+        help="Directory for cached edits ('' disables the cache)",
+    )
     args = parser.parse_args()
 
-    modified = enhance_paths(args.paths, style=args.style, policy_path=args.policy)
+    modified = enhance_paths(
+        args.paths,
+        style=args.style,
+        policy_path=args.policy,
+        cache_dir=args.cache_dir or None,
+    )
     for m in modified:
         print(f"Updated {m}")
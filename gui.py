@@ -1,11 +1,94 @@
+import _tkinter
 import asyncio
 import tkinter as tk
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from collections.abc import Coroutine
+from pathlib import Path
 from tkinter import filedialog
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from jarvis.core.main import Jarvis
 from utils.logger import setup_logging
 
+# Entries kept in the session and command histories
+HISTORY_LIMIT = 5000
+# Characters per Text.insert when showing the history window
+HISTORY_CHUNK_SIZE = 4096
+# Above this many commands the Commands menu is split by initial letter
+MENU_BUCKET_THRESHOLD = 40
+
+
+def _drain_tk(root: tk.Tk) -> None:
+    """Handle every ready Tk event without blocking, then flush redraws.
+
+    Unlike ``root.update()`` this does not spin Tk's re-entrant update
+    loop. Raises :class:`tkinter.TclError` once the window is destroyed.
+    """
+    while root.tk.dooneevent(_tkinter.DONT_WAIT):
+        pass
+    root.update_idletasks()
+
+
+async def _poll_tk(root: tk.Tk) -> None:
+    """Fallback bridge: service Tk every 50ms until the window is closed."""
+    while True:
+        try:
+            _drain_tk(root)
+        except tk.TclError:
+            break
+        await asyncio.sleep(0.05)
+
+
+async def run_tk(root: tk.Tk) -> None:
+    """Service Tk from the running asyncio loop until the window is closed.
+
+    Tk blocks in its own notifier and is woken by window events, by the
+    asyncio selector becoming readable (I/O and ``call_soon_threadsafe``)
+    or by an ``after`` timer set for the next asyncio deadline, so an idle
+    GUI does not wake up at all. Loops without a selector (e.g. uvloop)
+    and Tk builds without file handlers (Windows) fall back to polling.
+    """
+    loop = asyncio.get_running_loop()
+    selector = getattr(loop, "_selector", None)
+    ready = getattr(loop, "_ready", None)
+    scheduled = getattr(loop, "_scheduled", None)
+    if (
+        selector is None
+        or ready is None
+        or scheduled is None
+        or not hasattr(root.tk, "createfilehandler")
+    ):
+        await _poll_tk(root)
+        return
+
+    fd = selector.fileno()
+    while True:
+        try:
+            _drain_tk(root)
+        except tk.TclError:
+            break
+        # Let asyncio run everything that is ready before blocking in Tk
+        await asyncio.sleep(0)
+        if ready:
+            continue
+        timer = None
+        if scheduled:
+            delay = scheduled[0].when() - loop.time()
+            timer = root.after(max(1, round(delay * 1000)), lambda: None)
+        # The selector stays readable until asyncio polls it, so the handler
+        # is only installed while blocking; otherwise update() would spin
+        root.tk.createfilehandler(fd, tk.READABLE, lambda *_: None)
+        try:
+            root.tk.dooneevent(0)
+        finally:
+            root.tk.deletefilehandler(fd)
+        if timer is not None:
+            try:
+                root.after_cancel(timer)
+            except tk.TclError:
+                pass
+
 
 async def main() -> None:
     setup_logging()
@@ -15,7 +98,8 @@ async def main() -> None:
     command_names: List[str] = sorted(set(jarvis.commands.keys()))
     completion_state: Dict[str, object] = {
         "prefix": "",
-        "matches": [],
+        "lo": 0,
+        "hi": 0,
         "index": 0,
     }
 
@@ -40,23 +124,52 @@ async def main() -> None:
     voice_task: asyncio.Task | None = None
     voice_active = False
     cleanup_task: asyncio.Task | None = None
-    history: list[str] = []
-    command_history: list[str] = []
+    history: deque[str] = deque(maxlen=HISTORY_LIMIT)
+    command_history: deque[str] = deque(maxlen=HISTORY_LIMIT)
     history_index = 0
+    # Strong references keep fire-and-forget tasks alive until they finish
+    background_tasks: set[asyncio.Task] = set()
+
+    def spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        return task
+
+    # Lines waiting to be written to ``output`` in one insert per idle tick
+    pending_lines: deque[str] = deque()
+    flush_scheduled = False
+
+    def flush_output() -> None:
+        nonlocal flush_scheduled
+        flush_scheduled = False
+        if pending_lines:
+            output.insert(tk.END, "".join(pending_lines))
+            pending_lines.clear()
+            output.see(tk.END)
+
+    def write_output(line: str) -> None:
+        nonlocal flush_scheduled
+        pending_lines.append(f"{line}\n")
+        if not flush_scheduled:
+            flush_scheduled = True
+            root.after_idle(flush_output)
 
     def autocomplete(event=None) -> str:
         prefix = entry.get()
         state = completion_state
         if prefix != state["prefix"]:
-            matches = [c for c in command_names if c.startswith(prefix)]
-            state["matches"] = matches
-            state["index"] = 0
-            state["prefix"] = prefix
-        matches = state.get("matches", [])
-        if not matches:
+            # command_names is sorted, so the matches form one contiguous slice
+            lo = bisect_left(command_names, prefix)
+            hi = bisect_right(
+                command_names, prefix, lo=lo, key=lambda c: c[: len(prefix)]
+            )
+            state.update(prefix=prefix, lo=lo, hi=hi, index=0)
+        lo, hi = state["lo"], state["hi"]
+        if lo == hi:
             return "break"
-        match = matches[state["index"]]
-        state["index"] = (state["index"] + 1) % len(matches)
+        match = command_names[lo + state["index"]]
+        state["index"] = (state["index"] + 1) % (hi - lo)
         entry.delete(0, tk.END)
         entry.insert(0, match)
         return "break"
@@ -65,25 +178,24 @@ async def main() -> None:
         try:
             result = await jarvis.handle_command(cmd)
         except Exception as exc:  # pragma: no cover - GUI feedback only
-            output.insert(tk.END, f"Error: {exc}\n")
+            write_output(f"Error: {exc}")
             history.append(f"Error: {exc}")
         else:
             if result is not None:
-                output.insert(tk.END, f"{result}\n")
+                write_output(f"{result}")
                 history.append(result)
-        output.see(tk.END)
 
     def send_command(event=None) -> None:  # type: ignore[override]
         nonlocal history_index
         cmd = entry.get().strip()
         if not cmd:
             return
-        output.insert(tk.END, f"> {cmd}\n")
+        write_output(f"> {cmd}")
         history.append(cmd)
         command_history.append(cmd)
         history_index = len(command_history)
         entry.delete(0, tk.END)
-        asyncio.create_task(run_command(cmd))
+        spawn(run_command(cmd))
 
     def navigate_up(event=None) -> str:
         nonlocal history_index
@@ -115,14 +227,15 @@ async def main() -> None:
             text = await jarvis.voice_interface.listen()
             if not text:
                 continue
-            output.insert(tk.END, f"Voice> {text}\n")
+            write_output(f"Voice> {text}")
             history.append(f"Voice> {text}")
-            if jarvis.settings.voice_activation_phrase in text:
-                command = text.split(jarvis.settings.voice_activation_phrase, 1)[
-                    -1
-                ].strip()
+            # Read per chunk so a phrase changed at runtime takes effect
+            phrase = jarvis.settings.voice_activation_phrase
+            _before, found, after = text.partition(phrase)
+            if found:
+                command = after.strip()
                 if command:
-                    output.insert(tk.END, f"> {command}\n")
+                    write_output(f"> {command}")
                     history.append(command)
                     await run_command(command)
             await asyncio.sleep(0.05)
@@ -134,7 +247,7 @@ async def main() -> None:
             voice_active = False
             voice_button.config(text="Start Voice")
         else:
-            voice_task = asyncio.create_task(voice_loop())
+            voice_task = spawn(voice_loop())
             voice_button.config(text="Stop Voice")
 
     entry.bind("<Return>", send_command)
@@ -151,13 +264,21 @@ async def main() -> None:
     root.config(menu=menu)
     file_menu = tk.Menu(menu, tearoff=False)
 
+    async def write_file(path: str, data: str) -> None:
+        try:
+            await asyncio.to_thread(Path(path).write_text, data, encoding="utf-8")
+        except OSError as exc:  # pragma: no cover - GUI feedback only
+            write_output(f"Error: {exc}")
+
     def save_output() -> None:
         path = filedialog.asksaveasfilename(defaultextension=".txt")
         if path:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(output.get("1.0", tk.END))
+            flush_output()
+            # Copy the text on the Tk thread; the disk write happens off it
+            spawn(write_file(path, output.get("1.0", tk.END)))
 
     def clear_output() -> None:
+        pending_lines.clear()
         output.delete("1.0", tk.END)
 
     file_menu.add_command(label="Save Output", command=save_output)
@@ -171,7 +292,20 @@ async def main() -> None:
         win.title("History")
         box = tk.Text(win, height=20, width=80)
         box.pack(fill=tk.BOTH, expand=True)
-        box.insert(tk.END, "\n".join(history))
+        # Insert in ~4 KB chunks rather than materialising the whole history
+        chunk: list[str] = []
+        size = 0
+        for item in history:
+            line = f"{item}\n"
+            chunk.append(line)
+            size += len(line)
+            if size >= HISTORY_CHUNK_SIZE:
+                box.insert(tk.END, "".join(chunk))
+                chunk.clear()
+                size = 0
+        if chunk:
+            box.insert(tk.END, "".join(chunk))
+        box.configure(state=tk.DISABLED)
 
     view_menu = tk.Menu(menu, tearoff=False)
     view_menu.add_command(label="History", command=show_history)
@@ -214,15 +348,31 @@ async def main() -> None:
     menu.add_cascade(label="Settings", menu=settings_menu)
 
     commands_menu = tk.Menu(menu, tearoff=False)
-    added = set()
-    for name, cmd in jarvis.commands.items():
-        if cmd.is_alias or name in added:
-            continue
-        added.add(name)
-        commands_menu.add_command(
-            label=name,
-            command=lambda n=name: asyncio.create_task(run_command(n)),
-        )
+    primary = [name for name, cmd in jarvis.commands.items() if not cmd.is_alias]
+
+    def add_command_items(target: tk.Menu, names: list[str]) -> None:
+        for name in names:
+            target.add_command(
+                label=name,
+                command=lambda n=name: spawn(run_command(n)),
+            )
+
+    if len(primary) <= MENU_BUCKET_THRESHOLD:
+        add_command_items(commands_menu, primary)
+    else:
+        # One cascade per initial letter, filled the first time it opens
+        buckets: defaultdict[str, list[str]] = defaultdict(list)
+        for name in sorted(primary):
+            buckets[name[:1].upper()].append(name)
+        for letter, names in sorted(buckets.items()):
+            submenu = tk.Menu(commands_menu, tearoff=False)
+
+            def fill(submenu: tk.Menu = submenu, names: list[str] = names) -> None:
+                if submenu.index(tk.END) is None:
+                    add_command_items(submenu, names)
+
+            submenu.configure(postcommand=fill)
+            commands_menu.add_cascade(label=letter, menu=submenu)
     menu.add_cascade(label="Commands", menu=commands_menu)
 
     async def shutdown() -> None:
@@ -231,6 +381,7 @@ async def main() -> None:
             voice_active = False
             await voice_task
             voice_task = None
+        await asyncio.gather(*background_tasks, return_exceptions=True)
         if jarvis.voice_interface and jarvis.voice_interface.is_active:
             jarvis.voice_interface.stop()
         await jarvis.sensor_manager.stop()
@@ -244,15 +395,7 @@ async def main() -> None:
 
     root.protocol("WM_DELETE_WINDOW", on_close)
 
-    async def tk_loop() -> None:
-        while True:
-            try:
-                root.update()
-            except tk.TclError:
-                break
-            await asyncio.sleep(0.05)
-
-    await tk_loop()
+    await run_tk(root)
     if cleanup_task is not None:
         await cleanup_task
 
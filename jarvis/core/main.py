@@ -2,6 +2,7 @@ import argparse
 import asyncio
 import code
 import logging
+import os
 import time
 from collections.abc import Awaitable
 from dataclasses import dataclass
@@ -42,6 +43,8 @@ from utils.logger import get_logger, setup_logging
 from utils.update_checker import check_for_updates
 
 logger = get_logger().getChild("Core")
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 BUILTIN_EVENTS = [
     "voice_command",
@@ -91,16 +94,27 @@ class Settings(BaseSettings):
     def load(cls, yaml_path: str = "config.yaml") -> "Settings":
         """Load settings optionally overriding values from a YAML file."""
         data = {}
-        yaml_file = Path(yaml_path)
-        if yaml_file.exists():
+        try:
+            st = os.stat(yaml_path)
+        except OSError:
+            st = None
+        if st is not None:
             try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                data = _read_yaml_config(
+                    os.fspath(yaml_path), st.st_mtime_ns, st.st_size
+                )
             except Exception as e:
                 logger.warning(f"Failed to read {yaml_path}: {e}")
         return cls(**data)
 
 
+@lru_cache(maxsize=8)
+def _read_yaml_config(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns and size only key the cache so an edited file is re-parsed
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 @dataclass
 class RegisteredCommand:
     info: CommandInfo
@@ -135,6 +149,9 @@ class Jarvis:
         self._setup_state_machine()
 
         self.commands: dict[str, RegisteredCommand] = {}
+        # Lower-cased names and aliases -> command, rebuilt from self.commands
+        self._command_index: dict[str, RegisteredCommand] = {}
+        self._command_words = 1
         self._memory = None
         self._voice_interface = None
         self._register_commands()
@@ -259,6 +276,7 @@ class Jarvis:
                 self.commands[alias] = RegisteredCommand(
                     info=cmd_info, handler=handler, is_alias=True
                 )
+        self._rebuild_command_index()
 
     async def _init_step(self, name: str, func: Callable, threshold: float) -> None:
         """Run an initialization step and log its duration."""
@@ -357,13 +375,37 @@ class Jarvis:
 
     def _parse_input_uncached(self, text: str) -> dict:
         text = text.lower().strip()
+        parsed = self._match_command(text)
+        if parsed is None:
+            # Plugins add entries to self.commands directly, so a miss may
+            # just mean the index is stale
+            self._rebuild_command_index()
+            parsed = self._match_command(text)
+        return parsed
+
+    def _rebuild_command_index(self) -> None:
+        index: dict[str, RegisteredCommand] = {}
+        for key, cmd in self.commands.items():
+            index.setdefault(key.lower(), cmd)
         for cmd in self.commands.values():
-            if text.startswith(cmd.info.name) or any(
-                text.startswith(a) for a in cmd.info.aliases
-            ):
+            index.setdefault(cmd.info.name.lower(), cmd)
+            for alias in cmd.info.aliases or ():
+                index.setdefault(alias.lower(), cmd)
+        self._command_index = index
+        self._command_words = max((len(key.split()) for key in index), default=1)
+
+    def _match_command(self, text: str) -> dict | None:
+        # Try the longest leading phrase first so "включи голос" wins over
+        # a one-word name; each attempt is a single dict lookup.
+        for n in range(self._command_words, 0, -1):
+            parts = text.split(maxsplit=n)
+            if len(parts) < n:
+                continue
+            cmd = self._command_index.get(" ".join(parts[:n]))
+            if cmd is not None:
                 return {
                     "command": cmd.info.name,
-                    "args": text[len(cmd.info.name) :].strip(),
+                    "args": parts[n] if len(parts) > n else "",
                 }
         return None
 
@@ -14,6 +14,7 @@ from pydantic import BaseModel, ValidationError
 
 from core.fallback_manager import FallbackManager
 from core.flags import default_flag_manager
+from core.module_registry import invalidate_active_modules
 from core.profiler import default_profiler
 from utils.logger import get_logger
 
@@ -193,6 +194,7 @@ class ModuleManager:
 
             self._apply_profiler(module_name, module)
             self.modules[module_name] = module
+            invalidate_active_modules()
             self.module_states[module_name] = ModuleState.LOADED
             logger.info(f"Module {module_name} loaded successfully")
             return True
@@ -206,6 +208,7 @@ class ModuleManager:
 
             self.module_states[module_name] = ModuleState.RELOADING
             module = self.modules.pop(module_name)
+            invalidate_active_modules()
 
             if hasattr(module, "cleanup"):
                 with time_operation(f"Module {module_name} cleanup"):
@@ -232,6 +235,7 @@ class ModuleManager:
                 logger.warning(f"Module {module_name} not loaded")
                 return False
             module = self.modules.pop(module_name)
+            invalidate_active_modules()
             if hasattr(module, "cleanup"):
                 with time_operation(f"Module {module_name} pause"):
                     await module.cleanup()
@@ -1,16 +1,22 @@
 # -----------------------------
 # jarvis/core/project_manager.py
 # -----------------------------
+import asyncio
 import difflib
+import hashlib
 import inspect
 import json
 import os
 import platform
-import subprocess
+import re
+import sys
 import tempfile
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Awaitable
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum, auto
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable, Set, Union
 
@@ -27,10 +33,15 @@ import patch
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from utils.fs import iter_files, iter_py_files
 from utils.logger import get_logger
 
 logger = get_logger().getChild("ProjectManager")
 
+# Seconds a project scan stays in Redis
+SCAN_CACHE_TTL = 3600
+HISTORY_FILE = "project_history.json"
+
 
 class ProjectLifecycleException(Exception):
     """Исключения жизненного цикла проекта"""
@@ -65,16 +76,29 @@ class ProjectMetadata:
 
 
 class _TemplateEditHandler(FileSystemEventHandler):
-    """Watchdog handler to record file modifications."""
+    """Watchdog handler to record file modifications.
+
+    Events only append the raw path to a deque, which is safe from the
+    observer thread without a lock; paths are deduplicated and made
+    relative in one batch by :meth:`drain`.
+    """
 
     def __init__(self, manager: "ProjectManager", root: str) -> None:
         super().__init__()
         self.manager = manager
         self.root = root
+        self._pending: deque[str] = deque()
 
     def _record(self, src_path: str) -> None:
-        rel = os.path.relpath(src_path, self.root)
-        self.manager._modified_files.add(rel)
+        self._pending.append(src_path)
+
+    def drain(self) -> set[str]:
+        """Return relative paths recorded since the last drain."""
+        pending = self._pending
+        paths = set()
+        while pending:
+            paths.add(pending.popleft())
+        return {os.path.relpath(path, self.root) for path in paths}
 
     def on_modified(self, event):
         if not event.is_directory:
@@ -89,8 +113,8 @@ class ProjectManager:
     def __init__(self, jarvis: Any):
         self.jarvis = jarvis
         self.current_project : None | [dict[str, Any]] = None
-        self._project_history: list[dict[str, Any]] = []
         self._MAX_HISTORY = 10
+        self._project_history: deque[dict[str, Any]] = deque(maxlen=self._MAX_HISTORY)
         self._CONFIG_FILE = ".jarvis_project"
         self._hooks: dict[str, list[Callable]] = {
             "pre_create": [],
@@ -99,10 +123,10 @@ class ProjectManager:
             "post_close": [],
         }
         self._redis = None  # Для кеширования
-        self._docker_client = (
-            docker.from_env() if docker and self._docker_available() else None
-        )
+        # Project path -> (tree signature, serialized stats and intelligence)
+        self._scan_cache: dict[str, tuple[str, str]] = {}
         self._observer = None  # Для наблюдения за файлами
+        self._edit_handler: _TemplateEditHandler | None = None
         self._template_files: dict[str, str] = {}
         self._modified_files: Set[str] = set()
 
@@ -110,6 +134,8 @@ class ProjectManager:
         """Start filesystem observer to track user edits."""
         self._modified_files = set()
         handler = _TemplateEditHandler(self, str(path))
+        self._edit_handler = handler
+        # Observer already resolves to the inotify backend on Linux
         self._observer = Observer()
         self._observer.schedule(handler, str(path), recursive=True)
         try:
@@ -122,6 +148,12 @@ class ProjectManager:
             self._observer.stop()
             self._observer.join()
             self._observer = None
+        self._flush_modified()
+
+    def _flush_modified(self) -> None:
+        """Move batched watchdog events into ``_modified_files``."""
+        if self._edit_handler:
+            self._modified_files.update(self._edit_handler.drain())
 
     def _detect_project_type(self, path: Path) -> str:
         """Определяет тип проекта по его структуре."""
@@ -169,47 +201,36 @@ class ProjectManager:
             except Exception as e:
                 logger.error(f"Failed to load module {module}: {e}")
 
-    def _load_project_history(self, path: Path) -> list[dict[str, Any]]:
+    def _load_project_history(self, path: Path) -> deque[dict[str, Any]]:
         """Загружает историю проекта из файла."""
-        history_file = path / "project_history.json"
+        history_file = path / HISTORY_FILE
         if history_file.exists():
             try:
                 with open(history_file, encoding="utf-8") as f:
-                    return json.load(f)
+                    return deque(json.load(f), maxlen=self._MAX_HISTORY)
             except Exception:
                 logger.error("Failed to read project history")
-        return []
+        return deque(maxlen=self._MAX_HISTORY)
 
     def _update_project_history(self, event: str = "open") -> None:
         """Обновляет историю работы с проектом и сохраняет ее в файл."""
         if not self.current_project:
             return
         path = Path(self.current_project["path"])
-        history_file = path / "project_history.json"
-        history = self._project_history
-        history.append({"timestamp": datetime.now().isoformat(), "event": event})
-        history = history[-self._MAX_HISTORY :]
-        self._project_history = history
+        history_file = path / HISTORY_FILE
+        # maxlen drops the oldest entry once the limit is reached
+        self._project_history.append(
+            {"timestamp": datetime.now().isoformat(), "event": event}
+        )
         try:
             with open(history_file, "w", encoding="utf-8") as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+                json.dump(list(self._project_history), f, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Failed to write project history: {e}")
 
-    async def _calculate_project_stats(self, path: Path) -> dict[str, int]:
-        """Подсчет простых статистик по проекту."""
-        stats = {"files": 0, "lines": 0}
-        for root, _, files in os.walk(path):
-            for fname in files:
-                stats["files"] += 1
-                try:
-                    with open(
-                        Path(root) / fname, encoding="utf-8", errors="ignore"
-                    ) as f:
-                        stats["lines"] += sum(1 for _ in f)
-                except Exception:
-                    continue
-        return stats
+    def _bookkeeping_files(self, path: Path) -> frozenset[str]:
+        """Files Jarvis itself writes into the project; not project content."""
+        return frozenset({str(path / HISTORY_FILE), str(path / self._CONFIG_FILE)})
 
     async def _detect_vcs_needed(self) -> bool:
         return False
@@ -220,14 +241,40 @@ class ProjectManager:
     def _generate_ide_configs(self) -> None:
         pass
 
-    def _docker_available(self) -> bool:
+    @cached_property
+    def _docker_client(self) -> Any:
+        """Docker client, created on first use; None if the daemon is unreachable."""
         if docker is None:
-            return False
+            return None
         try:
-            docker.from_env().ping()
-            return True
+            client = docker.from_env()
+            client.ping()
         except Exception:
-            return False
+            return None
+        return client
+
+    def _docker_available(self) -> bool:
+        return self._docker_client is not None
+
+    def _build_docker_image(self, path: Path) -> None:
+        """Build the project image, reusing one built from identical sources.
+
+        Blocking; the client is resolved here so that the first daemon ping
+        also happens off the event loop.
+        """
+        client = self._docker_client
+        if client is None:
+            return
+        cached_tag = f"jarvis-base:{_context_digest(path)}"
+        try:
+            image = client.images.get(cached_tag)
+        except docker.errors.ImageNotFound:
+            image, _logs = client.images.build(
+                path=str(path),
+                tag=cached_tag,
+                buildargs={"BUILDKIT_INLINE_CACHE": "1"},
+            )
+        image.tag(path.name.lower(), "latest")
 
     # ███████╗███████╗████████╗████████╗███████╗██████╗ ███████╗
     # ██╔════╝██╔════╝╚══██╔══╝╚══██╔══╝██╔════╝██╔══██╗██╔════╝
@@ -280,14 +327,25 @@ class ProjectManager:
 
     async def _scan_project(self, path: Path) -> dict[str, Any]:
         """Глубокий анализ структуры проекта"""
+        exclude = self._bookkeeping_files(path)
+        signature = await asyncio.to_thread(_tree_signature, path, exclude)
+        cached = await self._cached_scan(path, signature)
+        if cached is None:
+            # One pass reads every file once for both stats and code analysis
+            stats, intelligence = await asyncio.to_thread(
+                _walk_and_compute, path, CodeAnalyzer(path), exclude
+            )
+            await self._cache_scan(path, signature, stats, intelligence)
+        else:
+            stats, intelligence = cached
         return {
             "name": path.name,
             "path": str(path),
             "system": platform.system(),
             "type": self._detect_project_type(path),
             "metadata": ProjectMetadata(),
-            "intelligence": ProjectIntelligence(),
-            "stats": await self._calculate_project_stats(path),
+            "intelligence": intelligence,
+            "stats": stats,
         }
 
     async def _analyze_project_intelligence(self) -> None:
@@ -295,13 +353,57 @@ class ProjectManager:
         if not self.current_project:
             return
 
-        path = Path(self.current_project["path"])
-        analyzer = CodeAnalyzer(path)
-        self.current_project["intelligence"] = await analyzer.run_analysis()
+        intelligence = self.current_project.get("intelligence")
+        if intelligence is None:
+            path = Path(self.current_project["path"])
+            intelligence = await CodeAnalyzer(path).run_analysis()
+            self.current_project["intelligence"] = intelligence
 
         # Автодополнение тегов
-        for tech in self.current_project["intelligence"].code_patterns:
-            self.current_project["metadata"].tags.add(f"tech:{tech}")
+        for tech in intelligence.code_patterns:
+            self.current_project["metadata"].tags.add(sys.intern(f"tech:{tech}"))
+
+    async def _cached_scan(
+        self, path: Path, signature: str
+    ) -> tuple[dict[str, int], ProjectIntelligence] | None:
+        """Return a previous scan of an unchanged project tree, if any."""
+        payload = None
+        local = self._scan_cache.get(str(path))
+        if local and local[0] == signature:
+            payload = local[1]
+        elif self._redis is not None:
+            try:
+                payload = await self._redis.get(f"proj:{signature}")
+            except Exception as e:
+                logger.warning(f"Redis lookup failed: {e}")
+        if payload is None:
+            return None
+        data = json.loads(payload)
+        intelligence = data["intelligence"]
+        # Tag and technology names repeat across projects; share one copy
+        intelligence["auto_tags"] = set(map(sys.intern, intelligence["auto_tags"]))
+        intelligence["code_patterns"] = {
+            sys.intern(tech): conf
+            for tech, conf in intelligence["code_patterns"].items()
+        }
+        return data["stats"], ProjectIntelligence(**intelligence)
+
+    async def _cache_scan(
+        self,
+        path: Path,
+        signature: str,
+        stats: dict[str, int],
+        intelligence: ProjectIntelligence,
+    ) -> None:
+        data = asdict(intelligence)
+        data["auto_tags"] = sorted(data["auto_tags"])
+        payload = json.dumps({"stats": stats, "intelligence": data})
+        self._scan_cache[str(path)] = (signature, payload)
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"proj:{signature}", payload, ex=SCAN_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"Redis store failed: {e}")
 
     # ██████╗ ██████╗ ███████╗ █████╗ ████████╗███████╗
     # ██╔══██╗██╔══██╗██╔════╝██╔══██╗╚══██╔══╝██╔════╝
@@ -389,27 +491,39 @@ class ProjectManager:
             return
 
         path = Path(self.current_project["path"])
+        # Independent steps run concurrently instead of blocking the loop
+        steps: list[Awaitable[Any]] = []
 
         # 1. Инициализация VCS
         if await self._detect_vcs_needed():
-            subprocess.run(["git", "init"], cwd=path)
+            steps.append(self._run_command("git", "init", cwd=path))
 
         # 2. Создание виртуального окружения
         if self._should_create_venv():
-            subprocess.run(["python", "-m", "venv", "venv"], cwd=path)
+            steps.append(
+                self._run_command(sys.executable, "-m", "venv", "venv", cwd=path)
+            )
 
         # 3. Генерация IDE конфигов
         self._generate_ide_configs()
 
-        # 4. Docker-инициализация
-        if (
-            self._docker_client
-            and self._docker_available()
-            and (path / "Dockerfile").exists()
-        ):
-            self._docker_client.images.build(
-                path=str(path), tag=f"{path.name.lower()}:latest"
-            )
+        await asyncio.gather(*steps)
+
+        # 4. Docker-инициализация: the build context digest reads the tree,
+        # so it waits until git and venv have finished writing to it
+        if docker is not None and (path / "Dockerfile").exists():
+            await asyncio.to_thread(self._build_docker_image, path)
+
+    @staticmethod
+    async def _run_command(*args: str, cwd: Path) -> int:
+        """Run *args* in *cwd* without blocking the event loop."""
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await proc.wait()
 
     async def close_project(self) -> bool:
         """Finalize project work and analyze modifications."""
@@ -428,24 +542,11 @@ class ProjectManager:
         if not self._template_files:
             return
         project_path = Path(self.current_project["path"])
-        diffs: dict[str, str] = {}
-        for rel, original in self._template_files.items():
-            file_path = project_path / rel
-            if file_path.exists():
-                current = file_path.read_text()
-                if current != original:
-                    diff = "\n".join(
-                        difflib.unified_diff(
-                            original.splitlines(),
-                            current.splitlines(),
-                            fromfile=f"template/{rel}",
-                            tofile=f"current/{rel}",
-                            lineterm="",
-                        )
-                    )
-                    diffs[rel] = diff
-            else:
-                diffs[rel] = "FILE REMOVED"
+        # Every template file is compared: watchdog drops events still queued
+        # when the observer stops, so _modified_files can miss late edits.
+        # Reading and diffing are blocking work; keep them off the event loop
+        templates = list(self._template_files.items())
+        diffs = await asyncio.to_thread(_template_diffs, project_path, templates)
 
         if diffs:
             history = self.jarvis.memory.query("project_templates.history")
@@ -519,6 +620,8 @@ class ProjectManager:
 class CodeAnalyzer:
     """AI-анализатор кодовой базы проекта"""
 
+    SCAN_CONCURRENCY = 32
+
     def __init__(self, project_path: Path):
         self.path = project_path
         self.tech_patterns = {
@@ -526,26 +629,209 @@ class CodeAnalyzer:
             "django": (r"from django\.", 0.95),
             "pandas": (r"import pandas", 0.8),
         }
+        # One alternation over raw bytes finds every technology in one pass
+        self._combined = re.compile(
+            "|".join(
+                f"(?P<{tech}>{pattern})"
+                for tech, (pattern, _conf) in self.tech_patterns.items()
+            ).encode()
+        )
 
     async def run_analysis(self) -> ProjectIntelligence:
-        """Запуск анализа с использованием ML-моделей"""
+        """Запуск анализа с использованием ML-моделей
+
+        Each source file is read once in a worker thread, at most
+        ``SCAN_CONCURRENCY`` at a time, and feeds both the technology
+        search and the tech-debt estimate.
+        """
+        sem = asyncio.Semaphore(self.SCAN_CONCURRENCY)
+
+        async def analyze(file_path: str) -> tuple[set[str], float, int]:
+            async with sem:
+                return await asyncio.to_thread(self._analyze_file, file_path)
+
+        results = await asyncio.gather(
+            *(analyze(entry.path) for entry in iter_py_files(self.path))
+        )
+        found: set[str] = set()
+        points = 0.0
+        lines = 0
+        for techs, file_points, file_lines in results:
+            found |= techs
+            points += file_points
+            lines += file_lines
+        return self.build_result(found, points, lines)
+
+    def analyze_source(self, data: bytes) -> tuple[set[str], float, int]:
+        """Return ``(technologies, debt points, line count)`` for one file."""
+        techs = {m.lastgroup for m in self._combined.finditer(data)}
+        points, lines = _debt_for_source(data)
+        return techs, points, lines
+
+    def build_result(
+        self, found: set[str], points: float, lines: int
+    ) -> ProjectIntelligence:
+        """Combine per-file findings into a :class:`ProjectIntelligence`."""
         result = ProjectIntelligence()
 
         # Анализ технологического стека
-        for tech, (pattern, conf) in self.tech_patterns.items():
-            if await self._search_in_files(pattern):
+        for tech, (_pattern, conf) in self.tech_patterns.items():
+            if tech in found:
                 result.code_patterns[tech] = conf
 
-        # Расчет технического долга (упрощенный пример)
-        result.tech_debt_score = await self._calculate_tech_debt()
-
+        # Технический долг: взвешенные находки на 100 строк
+        result.tech_debt_score = round(points * 100 / lines, 2) if lines else 0.0
         return result
 
-    async def _search_in_files(self, pattern: str) -> bool:
-        """Поиск паттернов в файлах проекта"""
-        # Реализация с использованием aiofiles для асинхронного чтения
-        # ...
-        return False
+    def _analyze_file(self, file_path: str) -> tuple[set[str], float, int]:
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return set(), 0.0, 0
+        return self.analyze_source(data)
+
+
+# .dockerignore wildcards; "*" and "?" never cross a path separator
+_GLOB_REGEX = {"**": ".*", "*": "[^/]*", "?": "[^/]"}
+
+
+def _dockerignore_rules(path: Path) -> list[tuple[re.Pattern[str], bool]]:
+    """Compile ``.dockerignore`` into ``(pattern, excludes)`` rules in order."""
+    try:
+        lines = (path / ".dockerignore").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        excludes = not line.startswith("!")
+        pattern = os.path.normpath(line.lstrip("!").strip()).lstrip("/")
+        regex = "".join(
+            _GLOB_REGEX.get(part) or re.escape(part)
+            for part in re.split(r"(\*\*|\*|\?)", pattern)
+        )
+        rules.append((re.compile(regex), excludes))
+    return rules
+
+
+def _docker_ignored(rel: str, rules: list[tuple[re.Pattern[str], bool]]) -> bool:
+    """Apply docker's last-match-wins rules to *rel* and its parent dirs."""
+    parts = rel.split("/")
+    prefixes = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+    ignored = False
+    for regex, excludes in rules:
+        if any(regex.fullmatch(prefix) for prefix in prefixes):
+            ignored = excludes
+    return ignored
+
+
+def _context_digest(path: Path) -> str:
+    """Digest the names and contents of every file in a docker build context.
+
+    The file set matches what ``docker build`` sends: everything below
+    *path* except what ``.dockerignore`` excludes.
+    """
+    rules = _dockerignore_rules(path)
+    files = []
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            rel = Path(dirpath, name).relative_to(path).as_posix()
+            if not _docker_ignored(rel, rules):
+                files.append(rel)
+    digest = hashlib.blake2b(digest_size=16)
+    for rel in sorted(files):
+        digest.update(rel.encode() + b"\0")
+        digest.update((path / rel).read_bytes())
+    return digest.hexdigest()
+
+
+def _tree_signature(path: Path, exclude: frozenset[str]) -> str:
+    """Digest the path, mtime and size of every file a project scan reads."""
+    entries = []
+    for entry in iter_files(path):
+        if entry.path in exclude:
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}")
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(path).encode("utf-8", "surrogateescape"))
+    for entry in sorted(entries):
+        digest.update(b"\n")
+        digest.update(entry.encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+_DEBT_MARKERS = (b"TODO", b"FIXME", b"XXX", b"HACK")
+_LONG_LINE = 100
+_DEEP_INDENT = b" " * 16
+
+
+def _debt_for_source(data: bytes) -> tuple[float, int]:
+    """Return ``(debt points, line count)`` for one source file's bytes.
+
+    Markers weigh 1, over-long lines 0.5 and deeply indented lines 0.25;
+    the counting uses bytes methods, so no decoding is needed.
+    """
+    points = float(sum(data.count(marker) for marker in _DEBT_MARKERS))
+    lines = data.splitlines()
+    for line in lines:
+        if len(line) > _LONG_LINE:
+            points += 0.5
+        if line.startswith(_DEEP_INDENT):
+            points += 0.25
+    return points, len(lines)
+
+
+def _count_lines(file_path: str) -> int:
+    """Count lines of an arbitrary, possibly large, file in fixed-size chunks."""
+    count = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    return count if last == b"\n" else count + 1
+
+
+def _walk_and_compute(
+    path: Path, analyzer: CodeAnalyzer, exclude: frozenset[str]
+) -> tuple[dict[str, int], ProjectIntelligence]:
+    """Read every project file once, producing stats and code analysis together.
+
+    Sources are read whole and shared between line counting and the
+    analyzer; other files are only streamed to count their lines. The
+    ``files`` and ``lines`` stats cover project sources only: directories
+    in :data:`utils.fs.PRUNED_DIRS` (``.git``, virtualenvs, build output)
+    and the bookkeeping files in ``exclude`` are not counted.
+    """
+    stats = {"files": 0, "lines": 0}
+    found: set[str] = set()
+    points = 0.0
+    py_lines = 0
+    for entry in iter_files(path):
+        if entry.path in exclude:
+            continue
+        stats["files"] += 1
+        try:
+            if not entry.name.endswith(".py"):
+                stats["lines"] += _count_lines(entry.path)
+                continue
+            with open(entry.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        techs, file_points, file_lines = analyzer.analyze_source(data)
+        found |= techs
+        points += file_points
+        py_lines += file_lines
+        stats["lines"] += file_lines
+    return stats, analyzer.build_result(found, points, py_lines)
 
 
 TEMPLATES = {
@@ -560,6 +846,32 @@ FILE_TO_TEMPLATE_KEY = {
 }
 
 
+def _template_diffs(
+    project_path: Path, templates: list[tuple[str, str]]
+) -> dict[str, str]:
+    """Return unified diffs of project files that differ from their template."""
+    diffs: dict[str, str] = {}
+    for rel, original in templates:
+        file_path = project_path / rel
+        try:
+            current = file_path.read_text()
+        except FileNotFoundError:
+            diffs[rel] = "FILE REMOVED"
+            continue
+        if current == original:
+            continue
+        diffs[rel] = "\n".join(
+            difflib.unified_diff(
+                original.splitlines(),
+                current.splitlines(),
+                fromfile=f"template/{rel}",
+                tofile=f"current/{rel}",
+                lineterm="",
+            )
+        )
+    return diffs
+
+
 def _apply_diff(original: str, diff_text: str) -> str:
     """Apply unified diff to a text string using the patch library."""
     try:
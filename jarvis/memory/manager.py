@@ -5,11 +5,34 @@ import shutil
 import time
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 from utils.logger import get_logger
 
 logger = get_logger().getChild("Memory")
 
 
+def _loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path: str, data: Any) -> None:
+    if orjson is not None:
+        payload = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        with open(path, "wb") as f:
+            f.write(payload)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 class MemoryManager:
     def __init__(
         self, memory_file: str = "jarvis_memory.json", auto_save: bool = False
@@ -39,9 +62,9 @@ class MemoryManager:
 
         if os.path.exists(self.memory_file):
             try:
-                with open(self.memory_file, encoding="utf-8") as f:
+                with open(self.memory_file, "rb") as f:
                     data = f.read()
-                loaded = json.loads(data)
+                loaded = _loads(data)
                 return {**base_structure, **loaded}
             except Exception as e:
                 logger.error(f"Ошибка загрузки памяти: {e}")
@@ -54,11 +77,7 @@ class MemoryManager:
             if os.path.exists(self.memory_file):
                 shutil.copy(self.memory_file, f"{self.memory_file}.bak")
 
-            def _write():
-                with open(self.memory_file, "w", encoding="utf-8") as f:
-                    json.dump(self.memory, f, indent=2, ensure_ascii=False)
-
-            await asyncio.to_thread(_write)
+            await asyncio.to_thread(_write_json, self.memory_file, self.memory)
         except Exception as e:
             logger.error(f"Ошибка сохранения памяти: {e}")
 
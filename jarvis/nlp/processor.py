@@ -93,6 +93,9 @@ class NLUProcessor:
         self.synonyms: dict[str, str] = self._load_synonyms()
         self.context: dict[str, Any] = {}
         self.history: deque[ProcessingResult] = deque(maxlen=max_history_size)
+        # Bumped whenever patterns or corrections change; lets callers that
+        # cache results know they are stale
+        self.revision = 0
         self.intent_dataset_path = (
             Path(intent_dataset_path)
             if intent_dataset_path
@@ -355,6 +358,14 @@ class NLUProcessor:
             semantics_confidence=sem_conf,
         )
 
+    def record_history(self, result: dict[str, Any]) -> None:
+        """Append a result previously returned by :meth:`process` to history.
+
+        Used by callers that answer a repeated utterance from a cache so
+        "повтори" and the intent model context still see it.
+        """
+        self._update_history(ProcessingResult(**result))
+
     def _update_history(self, result: ProcessingResult) -> None:
         """Обновляет историю обработки команд."""
         self.history.append(result)
@@ -427,6 +438,7 @@ class NLUProcessor:
             description="User taught pattern",
         )
         self.command_patterns.append(pattern)
+        self.revision += 1
         if persist and self.memory_manager:
             existing = self.memory_manager.recall("nlu.custom_patterns") or []
             existing.append(
@@ -445,6 +457,7 @@ class NLUProcessor:
     ) -> None:
         """Запоминает исправление неверно распознанной команды."""
         self.learned_corrections[wrong_text.lower()] = intent
+        self.revision += 1
         if persist:
             if self.memory_manager:
                 await self.memory_manager.remember(
@@ -486,3 +499,4 @@ class NLUProcessor:
 
         corrections = self.memory_manager.recall("nlu.corrections") or {}
         self.learned_corrections.update({k.lower(): v for k, v in corrections.items()})
+        self.revision += 1
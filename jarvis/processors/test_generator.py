@@ -9,6 +9,8 @@ from .base import BaseThoughtProcessor
 
 logger = get_logger().getChild("Processor.TestGen")
 
+FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
 
 class TestGeneratorProcessor(BaseThoughtProcessor):
     """Generates pytest tests from function docstrings or name."""
@@ -35,8 +37,9 @@ class TestGeneratorProcessor(BaseThoughtProcessor):
         if source:
             try:
                 tree = ast.parse(source)
+                # Only module-level functions can be called by name in a test
                 for node in tree.body:
-                    if isinstance(node, ast.FunctionDef) and node.name == fn_name:
+                    if isinstance(node, FUNC_TYPES) and node.name == fn_name:
                         doc = ast.get_docstring(node)
                         if doc:
                             for expr, expected in self._extract_examples(doc):
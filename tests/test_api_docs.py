@@ -0,0 +1,22 @@
+import pydoc
+
+from codex import api_docs
+
+
+def test_generate_api_docs_reuses_rendered_doc(tmp_path, monkeypatch):
+    calls = []
+    real_render = pydoc.render_doc
+
+    def counting_render(*args, **kwargs):
+        calls.append(args[0])
+        return real_render(*args, **kwargs)
+
+    monkeypatch.setattr(pydoc, "render_doc", counting_render)
+    api_docs._render_doc.cache_clear()
+
+    first = api_docs.generate_api_docs("json", str(tmp_path / "a" / "json.txt"))
+    second = api_docs.generate_api_docs("json", str(tmp_path / "b" / "json.txt"))
+
+    assert calls == ["json"]
+    assert "json" in (tmp_path / "a" / "json.txt").read_text(encoding="utf-8")
+    assert open(first).read() == open(second).read()
@@ -0,0 +1,38 @@
+from codex.autotest_generation import generate_autotests
+
+
+def test_generate_autotests_writes_file_per_function(tmp_path):
+    src = tmp_path / "sample.py"
+    src.write_text(
+        'def add(a, b):\n    """\n    >>> add(1, 2)\n    3\n    """\n'
+        "    return a + b\n\n\ndef noop():\n    pass\n\n\n"
+        "async def fetch():\n    pass\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "tests"
+
+    written = generate_autotests(str(src), str(out_dir))
+
+    assert [p.rsplit("/", 1)[-1] for p in written] == [
+        "test_add.py",
+        "test_noop.py",
+        "test_fetch.py",
+    ]
+    assert "assert add(1, 2) == 3" in (out_dir / "test_add.py").read_text()
+    assert "assert noop() is not None" in (out_dir / "test_noop.py").read_text()
+
+
+def test_generate_autotests_skips_methods_and_dunders(tmp_path):
+    src = tmp_path / "sample.py"
+    src.write_text(
+        "class Box:\n    def __init__(self):\n        self.items = []\n\n"
+        "    def put(self, item):\n        self.items.append(item)\n\n\n"
+        "def make_box():\n    return Box()\n\n\n"
+        "def __getattr__(name):\n    raise AttributeError(name)\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "tests"
+
+    written = generate_autotests(str(src), str(out_dir))
+
+    assert [p.rsplit("/", 1)[-1] for p in written] == ["test_make_box.py"]
@@ -1,10 +1,12 @@
 import asyncio
 import io
+import os
 import sys
 
 import pytest
 
 import cli
+from command_dispatcher import CommandDispatcher
 from jarvis.core.main import Jarvis
 
 
@@ -61,3 +63,88 @@ async def test_cli_chained_commands(monkeypatch):
     output = stdout.getvalue()
     assert "Available commands" in output
     assert output.find("Available commands") < output.find("Exiting Jarvis")
+
+
+@pytest.mark.asyncio
+async def test_nlu_cache_reuses_results(monkeypatch):
+    jarvis = Jarvis()
+    nlu = jarvis.nlu
+    calls = []
+    real_process = nlu.process
+
+    async def counting_process(text):
+        calls.append(text)
+        return await real_process(text)
+
+    monkeypatch.setattr(nlu, "process", counting_process)
+    cache = cli.NLUCache(jarvis, maxsize=2)
+
+    first = await cache.process("Hello World")
+    history_len = len(nlu.history)
+    second = await cache.process("Hello World")
+    assert calls == ["Hello World"]
+    assert second == first
+    assert second is not first
+    # Hits still count as the latest utterance for "повтори"
+    assert len(nlu.history) == history_len + 1
+
+    second["entities"]["raw_args"] = "mutated"
+    assert (await cache.process("Hello World"))["entities"] != second["entities"]
+
+    # Entities keep the original case, so case variants are separate entries
+    await cache.process("hello world")
+    assert calls == ["Hello World", "hello world"]
+
+    await cache.process("повтори")
+    await cache.process("повтори")
+    assert calls.count("повтори") == 2
+
+    await cache.process("a")
+    await cache.process("b")
+    await cache.process("Hello World")
+    assert calls[-1] == "Hello World"
+
+
+@pytest.mark.asyncio
+async def test_nlu_cache_drops_entries_when_corrections_change(monkeypatch):
+    jarvis = Jarvis()
+    cache = cli.NLUCache(jarvis)
+
+    await cache.process("frobnicate")
+    await jarvis.nlu.learn_correction("frobnicate", "help")
+
+    assert (await cache.process("frobnicate"))["intent"] == "help"
+
+
+def test_command_completer_prefix_search():
+    dispatcher = CommandDispatcher()
+    dispatcher.register("git", lambda: None, action="status")
+    dispatcher.register("git", lambda: None, action="commit")
+    completer = cli.CommandCompleter(dispatcher)
+
+    assert completer.matches("git ") == ["git commit", "git status"]
+    assert completer("git s", 0) == "git status"
+    assert completer("git s", 1) is None
+
+    dispatcher.register("gitlab", lambda: None)
+    assert completer.matches("git") == ["git commit", "git status", "gitlab"]
+
+
+@pytest.mark.asyncio
+async def test_stdin_reader_reads_lines_from_pipe():
+    read_fd, write_fd = os.pipe()
+    reader = cli.StdinReader(read_fd)
+    reader._start()
+    try:
+        os.write(write_fd, b"first\nsec")
+        assert await reader.readline() == "first"
+        os.write(write_fd, b"ond\n")
+        assert await reader.readline() == "second"
+        os.write(write_fd, b"tail")
+        os.close(write_fd)
+        assert await reader.readline() == "tail"
+        with pytest.raises(EOFError):
+            await reader.readline()
+    finally:
+        reader.close()
+        os.close(read_fd)
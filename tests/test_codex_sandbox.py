@@ -0,0 +1,33 @@
+import marshal
+import multiprocessing
+
+from codex.sandbox import exec_code, run_child
+
+
+def _marshalled(source: str) -> bytes:
+    return marshal.dumps(compile(source, "<task>", "exec"))
+
+
+def test_exec_code_captures_stdout():
+    assert exec_code(_marshalled("print(sum(range(4)))")) == (True, "6\n")
+    assert exec_code(_marshalled("x = 1")) == (True, "Execution successful")
+
+
+def test_exec_code_hides_unsafe_builtins():
+    ok, output = exec_code(_marshalled("open('/etc/passwd')"))
+    assert not ok
+    assert "open" in output
+
+
+def test_run_child_sends_result_over_pipe():
+    ctx = multiprocessing.get_context("spawn")
+    reader, writer = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=run_child, args=(_marshalled("print('hi')"), writer))
+    process.start()
+    writer.close()
+    try:
+        assert reader.poll(30)
+        assert reader.recv() == (True, "hi\n")
+    finally:
+        process.join()
+        reader.close()
@@ -17,3 +17,37 @@ def test_cache_eviction():
     cache.set("b", 2)
     assert cache.get("a") is None
     assert cache.get("b") == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ContextCache(max_size=2, shards=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_shards_keep_total_capacity():
+    cache = ContextCache(max_size=100, shards=16)
+    assert cache.shard_size * 16 >= 100
+    # Small ints hash to themselves, so 100 keys spread 7/6 over 16 shards
+    for i in range(100):
+        cache.set(i, i)
+    assert all(cache.get(i) == i for i in range(100))
+    cache.clear()
+    assert all(cache.get(i) is None for i in range(100))
+
+
+def test_cache_evicts_in_batches():
+    cache = ContextCache(max_size=20, shards=1)
+    for i in range(21):
+        cache.set(f"k{i}", i)
+    # Overflowing trims the shard to 90% in one pass
+    assert cache.get("k2") is None
+    assert cache.get("k3") == 3
+    cache.set("x", 0)
+    cache.set("y", 0)
+    assert cache.get("k4") == 4
@@ -0,0 +1,23 @@
+from jarvis.core.project_manager import _context_digest
+
+
+def test_context_digest_follows_dockerignore(tmp_path):
+    (tmp_path / "Dockerfile").write_text("FROM python:3.11\nCOPY . .\n")
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "app.whl").write_bytes(b"v1")
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "run.log").write_text("a")
+    (tmp_path / "logs" / "keep.log").write_text("a")
+    (tmp_path / ".dockerignore").write_text("# comment\nlogs\n!logs/keep.log\n")
+    digest = _context_digest(tmp_path)
+
+    # dist/ is part of the build context, so changing it changes the key
+    (tmp_path / "dist" / "app.whl").write_bytes(b"v2")
+    changed = _context_digest(tmp_path)
+    assert changed != digest
+
+    (tmp_path / "logs" / "run.log").write_text("b")
+    assert _context_digest(tmp_path) == changed
+
+    (tmp_path / "logs" / "keep.log").write_text("b")
+    assert _context_digest(tmp_path) != changed
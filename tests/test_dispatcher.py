@@ -1,6 +1,6 @@
 import pytest
 
-from command_dispatcher import CommandDispatcher, InvalidCommandError
+from command_dispatcher import CommandDispatcher, CommandError, InvalidCommandError
 
 
 @pytest.mark.asyncio
@@ -169,3 +169,95 @@ async def test_load_unload_reload_with_manager(monkeypatch):
     result = await dispatcher.dispatch("reload --module=demo")
     assert result == "Module demo reloaded"
     assert fake_reload.called == "demo"
+
+
+def test_install_uvloop_without_uvloop(monkeypatch):
+    import command_dispatcher
+
+    monkeypatch.setattr(command_dispatcher, "uvloop", None)
+    assert CommandDispatcher.install_uvloop() is False
+
+
+def test_configure_loop_sets_eager_factory():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        installed = CommandDispatcher.configure_loop(loop)
+        assert installed == hasattr(asyncio, "eager_task_factory")
+        if installed:
+            assert loop.get_task_factory() is asyncio.eager_task_factory
+    finally:
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_context_injected_without_per_call_signature(monkeypatch):
+    import inspect
+
+    dispatcher = CommandDispatcher()
+
+    def whoami(context) -> str:
+        return context["raw_input"]
+
+    dispatcher.register_command_handler("util", "whoami", whoami)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("signature should be cached at registration")
+
+    monkeypatch.setattr(inspect, "signature", fail)
+    assert await dispatcher.dispatch("util whoami") == "util whoami"
+
+
+def test_parse_quoted_and_plain_tokens():
+    dispatcher = CommandDispatcher()
+    assert dispatcher.parse("foo  bar\t--name=Jarvis") == (
+        "foo",
+        "bar",
+        {"name": "Jarvis"},
+    )
+    assert dispatcher.parse('foo bar --name="J arvis"') == (
+        "foo",
+        "bar",
+        {"name": "J arvis"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_is_per_instance():
+    first = CommandDispatcher()
+    second = CommandDispatcher()
+
+    async def lower_list(text: str) -> str:
+        return text.replace("LIST", "list")
+
+    first.register_middleware(lower_list)
+    first.register_middleware(lambda text: text.replace("_CMDS", "_commands"))
+
+    assert "help" in (await first.dispatch("LIST_CMDS")).splitlines()
+    assert await second.dispatch("LIST_CMDS") is None
+
+
+@pytest.mark.asyncio
+async def test_dispatch_chain_parallel():
+    import asyncio
+
+    dispatcher = CommandDispatcher()
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def wait(name: str) -> str:
+        started.append(name)
+        if len(started) == 2:
+            release.set()
+        await release.wait()
+        return name
+
+    dispatcher.register_command_handler("mod", "wait", wait)
+
+    results = await dispatcher.dispatch_chain(
+        ["mod wait --name=a", "mod wait --name=b", "mod wait --bad"],
+        parallel=True,
+    )
+    assert results[:2] == ["a", "b"]
+    assert isinstance(results[2], CommandError)
@@ -0,0 +1,97 @@
+import ast
+import os
+
+from doc.enhancer import enhance_file, enhance_paths
+
+
+def test_enhance_file_inserts_docstrings_at_original_positions(tmp_path):
+    src = tmp_path / "sample.py"
+    src.write_text(
+        "def first(a):\n"
+        "    return a\n"
+        "\n"
+        "\n"
+        "class Second:\n"
+        "    def method(self):\n"
+        "        return 1\n",
+        encoding="utf-8",
+    )
+
+    assert enhance_file(str(src), style="google") is True
+
+    tree = ast.parse(src.read_text(encoding="utf-8"))
+    assert ast.get_docstring(tree) == "Contains classes: Second; functions: first."
+    _doc, first, second = tree.body
+    assert ast.get_docstring(first) == "Function first with parameters a."
+    assert ast.get_docstring(second) == "Class Second with methods: method."
+
+
+def test_enhance_file_leaves_documented_file_untouched(tmp_path):
+    src = tmp_path / "done.py"
+    text = '"""Module."""\n\n\ndef f():\n    """Doc."""\n'
+    src.write_text(text, encoding="utf-8")
+
+    assert enhance_file(str(src), style="google") is False
+    assert src.read_text(encoding="utf-8") == text
+
+
+def test_enhance_paths_processes_directory(tmp_path):
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.py").write_text(f"def {name}():\n    pass\n")
+    (tmp_path / "done.py").write_text('"""Done."""\n')
+
+    changed = enhance_paths([str(tmp_path)], style="google")
+
+    assert sorted(os.path.basename(p) for p in changed) == ["a.py", "b.py", "c.py"]
+    assert ast.get_docstring(ast.parse((tmp_path / "b.py").read_text())) is not None
+
+
+def test_load_style_rereads_edited_policy(tmp_path):
+    from utils.docstring_helper import _load_style
+
+    policy = tmp_path / "policy.yaml"
+    assert _load_style(policy) == "google"
+
+    policy.write_text("docstring:\n  style: sphinx\n", encoding="utf-8")
+    assert _load_style(policy) == "sphinx"
+
+    policy.write_text("docstring:\n  style: numpy\n", encoding="utf-8")
+    st = policy.stat()
+    os.utime(policy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _load_style(policy) == "numpy"
+
+
+def test_enhance_file_reuses_cached_edits(tmp_path, monkeypatch):
+    import doc.enhancer as enhancer
+
+    cache = tmp_path / "cache"
+    src = tmp_path / "mod.py"
+    src.write_text("def f():\n    pass\n", encoding="utf-8")
+    original = src.read_text(encoding="utf-8")
+
+    assert enhance_file(str(src), style="google", cache_dir=cache) is True
+    enhanced = src.read_text(encoding="utf-8")
+    assert enhance_file(str(src), style="google", cache_dir=cache) is False
+    assert len(os.listdir(cache)) == 2
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached source should not be parsed")
+
+    monkeypatch.setattr(enhancer.ast, "parse", fail)
+    src.write_text(original, encoding="utf-8")
+    assert enhance_file(str(src), style="google", cache_dir=cache) is True
+    assert src.read_text(encoding="utf-8") == enhanced
+    assert enhance_file(str(src), style="google", cache_dir=cache) is False
+
+
+def test_prune_cache_drops_least_recently_used_entries(tmp_path):
+    from doc.enhancer import _prune_cache
+
+    for i in range(5):
+        entry = tmp_path / f"key{i}"
+        entry.write_text("[]", encoding="utf-8")
+        os.utime(entry, ns=(i, i))
+
+    _prune_cache(tmp_path, max_entries=2)
+
+    assert sorted(os.listdir(tmp_path)) == ["key3", "key4"]
@@ -0,0 +1,23 @@
+import os
+
+from utils.fs import iter_py_files
+
+
+def test_iter_py_files_prunes_junk_dirs(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    (tmp_path / "pkg" / "notes.txt").write_text("")
+    (tmp_path / "top.py").write_text("")
+    for junk in (".git", "venv", "__pycache__", "node_modules"):
+        (tmp_path / junk).mkdir()
+        (tmp_path / junk / "hidden.py").write_text("")
+
+    found = sorted(
+        os.path.relpath(entry.path, tmp_path) for entry in iter_py_files(tmp_path)
+    )
+
+    assert found == [os.path.join("pkg", "mod.py"), "top.py"]
+
+
+def test_iter_py_files_missing_root(tmp_path):
+    assert list(iter_py_files(tmp_path / "missing")) == []
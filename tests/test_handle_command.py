@@ -1,6 +1,7 @@
 import pytest
 
-from jarvis.core.main import Jarvis
+from commands.registry import CommandCategory, CommandInfo
+from jarvis.core.main import Jarvis, RegisteredCommand
 
 
 @pytest.mark.asyncio
@@ -18,3 +19,35 @@ async def test_handle_command_chain(monkeypatch):
 
     await jarvis.handle_command("help && help")
     assert calls == ["help", "help"]
+
+
+def test_parse_input_finds_plugin_commands():
+    jarvis = Jarvis()
+
+    async def handler(event):
+        return "ok"
+
+    # Plugins register by writing to jarvis.commands directly
+    jarvis.commands["plugin_cmd"] = RegisteredCommand(
+        info=CommandInfo(
+            name="plugin_cmd",
+            description="Test plugin command",
+            category=CommandCategory.UTILITY,
+            usage="plugin_cmd <arg>",
+            aliases=["pcmd"],
+        ),
+        handler=handler,
+    )
+
+    assert jarvis._parse_input_uncached("plugin_cmd spec.yaml out") == {
+        "command": "plugin_cmd",
+        "args": "spec.yaml out",
+    }
+    assert jarvis._parse_input_uncached("PCMD x") == {
+        "command": "plugin_cmd",
+        "args": "x",
+    }
+    assert jarvis._parse_input_uncached("help me") == {
+        "command": "help",
+        "args": "me",
+    }
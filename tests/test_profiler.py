@@ -17,3 +17,68 @@ def test_profiler_records_stats_and_warns(caplog):
     stats = profiler.get_stats()
     assert stats["dummy"]["heavy_func"]["peak_memory_kb"] > 10 * 1024
     assert any("Profiler" in r.message for r in caplog.records)
+
+
+def test_profiler_samples_and_skips_memory_tracing():
+    profiler = ModuleProfiler(sample_rate=3, trace_memory=False)
+    calls = []
+
+    def work():
+        calls.append(1)
+        return len(calls)
+
+    wrapped = profiler.profile("dummy", "work")(work)
+    assert [wrapped() for _ in range(4)] == [1, 2, 3, 4]
+    assert profiler._calls[("dummy", "work")] == 4
+    assert "peak_memory_kb" not in profiler.get_stats()["dummy"]["work"]
+
+
+def test_profiler_stops_tracing_after_exception():
+    import tracemalloc
+
+    import pytest
+
+    profiler = ModuleProfiler()
+
+    def boom():
+        raise ValueError("boom")
+
+    wrapped = profiler.profile("dummy", "boom")(boom)
+    with pytest.raises(ValueError):
+        wrapped()
+
+    assert not tracemalloc.is_tracing()
+    assert "boom" in profiler.get_stats()["dummy"]
+
+
+async def test_profiler_overlapping_calls_share_trace():
+    import asyncio
+    import tracemalloc
+
+    profiler = ModuleProfiler()
+    first_done = asyncio.Event()
+    release_first = asyncio.Event()
+
+    async def first():
+        await release_first.wait()
+
+    async def second():
+        data = bytearray(2 * 1024 * 1024)
+        release_first.set()
+        await first_done.wait()
+        return len(data)
+
+    wrapped_first = profiler.profile("dummy", "first")(first)
+    wrapped_second = profiler.profile("dummy", "second")(second)
+
+    # The call that started tracing finishes while the other still runs
+    first_task = asyncio.ensure_future(wrapped_first())
+    await asyncio.sleep(0)
+    second_task = asyncio.ensure_future(wrapped_second())
+    await first_task
+    assert tracemalloc.is_tracing()
+    first_done.set()
+    await second_task
+
+    assert not tracemalloc.is_tracing()
+    assert profiler.get_stats()["dummy"]["second"]["peak_memory_kb"] >= 2 * 1024
@@ -0,0 +1,14 @@
+from commands.registry import ALL_COMMANDS, COMMAND_INDEX, lookup
+
+
+def test_lookup_by_name_and_alias():
+    assert lookup("help").name == "help"
+    assert lookup("справка").name == "help"
+    assert lookup("goal").name == "set_goal"
+    assert lookup("HELP").name == "help"
+    assert lookup("Справка").name == "help"
+    assert lookup("missing") is None
+
+
+def test_index_covers_all_commands():
+    assert all(COMMAND_INDEX[info.name] is info for info in ALL_COMMANDS)
@@ -37,3 +37,46 @@ def test_load_custom_tasks(tmp_path):
     tasks = load_tasks(custom)
     assert len(tasks) == 1
     assert tasks[0].id == "t1"
+
+
+def test_load_tasks_reparses_changed_file(tmp_path):
+    import yaml
+
+    item = {
+        "id": "t1",
+        "title": "Example",
+        "description": "Desc",
+        "module": "mod",
+        "action": "act",
+        "estimated_minutes": 5,
+    }
+    custom = tmp_path / "tasks.yaml"
+    custom.write_text(yaml.safe_dump([item]), encoding="utf-8")
+    first = load_tasks(custom)
+    assert load_tasks(custom) == first
+
+    custom.write_text(yaml.safe_dump([item, {**item, "id": "t2"}]), encoding="utf-8")
+    assert [t.id for t in load_tasks(custom)] == ["t1", "t2"]
+
+
+def test_load_tasks_rejects_unknown_and_missing_keys(tmp_path):
+    import pytest
+    import yaml
+
+    item = {
+        "id": "t1",
+        "title": "Example",
+        "description": "Desc",
+        "module": "mod",
+        "action": "act",
+        "estimated_minutes": 5,
+    }
+    custom = tmp_path / "tasks.yaml"
+    custom.write_text(yaml.safe_dump([{**item, "extra": 1}]), encoding="utf-8")
+    with pytest.raises(TypeError, match="extra"):
+        load_tasks(custom)
+
+    del item["action"]
+    custom.write_text(yaml.safe_dump([item]), encoding="utf-8")
+    with pytest.raises(TypeError, match="action"):
+        load_tasks(custom)
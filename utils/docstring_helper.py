@@ -2,12 +2,15 @@
 
 import ast
 import os
+import stat
 from collections.abc import Iterable
-from pathlib import Path
+from functools import lru_cache
 from typing import List
 
 import yaml
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _generate_docstring(node: ast.AST | None, style: str, kind: str) -> str:
     """Return a placeholder docstring for the given ``kind``."""
@@ -48,18 +51,27 @@ def _indent_lines(text: str, indent: str) -> list[str]:
     return [f"{indent}{line}" if line else indent for line in text.splitlines()]
 
 
-def _load_style(policy_path: str | os.PathLike[str]) -> str:
-    path = Path(policy_path)
-    if not path.is_file():
-        return "google"
+@lru_cache(maxsize=8)
+def _read_style(path: str, mtime_ns: int) -> str:
+    # mtime_ns only keys the cache so an edited policy is re-read
     try:
         with open(path, encoding="utf-8") as fh:
-            cfg = yaml.safe_load(fh) or {}
+            cfg = yaml.load(fh, Loader=_YAML_LOADER) or {}
             return cfg.get("docstring", {}).get("style", "google")
     except Exception:
         return "google"
 
 
+def _load_style(policy_path: str | os.PathLike[str]) -> str:
+    try:
+        st = os.stat(policy_path)
+    except OSError:
+        return "google"
+    if not stat.S_ISREG(st.st_mode):
+        return "google"
+    return _read_style(os.fspath(policy_path), st.st_mtime_ns)
+
+
 def process_file(
     path: str,
     style: str | None = None,
@@ -0,0 +1,47 @@
+"""Filesystem helpers shared by the code analysis tools."""
+
+import os
+from collections.abc import Iterator
+
+# Directory names never worth descending into when looking for sources
+PRUNED_DIRS = frozenset(
+    {
+        ".git",
+        "venv",
+        ".venv",
+        "node_modules",
+        "__pycache__",
+        ".tox",
+        "build",
+        "dist",
+    }
+)
+
+
+def iter_files(
+    root: str | os.PathLike[str], suffix: str = ""
+) -> Iterator[os.DirEntry[str]]:
+    """Yield a directory entry for every file below ``root`` ending in ``suffix``.
+
+    Directories named in :data:`PRUNED_DIRS` are skipped and symlinked
+    directories are not followed. Entries keep the ``os.scandir`` stat
+    cache, so callers needing size or mtime pay for at most one ``stat``.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name in PRUNED_DIRS:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def iter_py_files(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Yield a directory entry for every ``.py`` file below ``root``."""
+    return iter_files(root, ".py")